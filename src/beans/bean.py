@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from config.loader import BeansConfig
 
-from .genetics import Genotype, Phenotype, extract_phenotype_values, genetic_max_age
+from .genetics import Gene, Genotype, Phenotype, extract_phenotype_values, genetic_max_age, metabolism_factor
 
 logger = logging.getLogger(__name__)
 
@@ -100,8 +100,22 @@ class Bean:
 
     Variables are expected to be set during construction. `update()` modifies the bean in place.
     Phenotype contains the mutable traits (age, speed, energy, size) that change over time.
+    Beans use ``__slots__`` since populations are large and their attributes are read every tick.
     """
 
+    __slots__ = (
+        "beans_config",
+        "id",
+        "sex",
+        "genotype",
+        "_phenotype",
+        "_max_age",
+        "_metabolism_factor",
+        "_fat_accumulation",
+        "alive",
+        "_dto",
+    )
+
     def __init__(
         self,
         config: BeansConfig,
@@ -117,29 +131,33 @@ class Bean:
         self.genotype = genotype
         self._phenotype = phenotype
         self._max_age = genetic_max_age(config, genotype)
+        self._metabolism_factor = metabolism_factor(genotype)
+        self._fat_accumulation = genotype[Gene.FAT_ACCUMULATION]
         self.alive = True
+        phenotype = self._phenotype
         self._dto = BeanState(
-            id=self.id,
-            age=self.age,
-            speed=self.speed,
-            energy=self.energy,
-            size=self.size,
-            target_size=self._phenotype.target_size,
-            alive=self.alive,
+            id=id,
+            age=phenotype.age,
+            speed=phenotype.speed,
+            energy=phenotype.energy,
+            size=phenotype.size,
+            target_size=phenotype.target_size,
+            alive=True,
         )
 
-        phenotype_str = (
-            f"age:{self._phenotype.age:.1f}, speed:{self._phenotype.speed:.2f}, "
-            f"alive:{self.alive}, energy:{self._phenotype.energy:.1f}, "
-            f"size:{self._phenotype.size:.2f}, target_size:{self._phenotype.target_size:.2f}"
-        )
-        logger.debug(
-            ">>>>> Bean %s created: sex=%s, genotype=%s, phenotype=%s",
-            self.id,
-            self.sex.value,
-            self.genotype.to_compact_str(),
-            phenotype_str,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            phenotype_str = (
+                f"age:{phenotype.age:.1f}, speed:{phenotype.speed:.2f}, "
+                f"alive:{self.alive}, energy:{phenotype.energy:.1f}, "
+                f"size:{phenotype.size:.2f}, target_size:{phenotype.target_size:.2f}"
+            )
+            logger.debug(
+                ">>>>> Bean %s created: sex=%s, genotype=%s, phenotype=%s",
+                self.id,
+                self.sex.value,
+                self.genotype.to_compact_str(),
+                phenotype_str,
+            )
 
     @property
     def age(self) -> float:
@@ -190,17 +208,21 @@ class Bean:
 
         Reuses a single DTO instance per Bean to minimize allocation in tight loops.
         """
+        phenotype = self._phenotype
         self._dto.store(
-            age=self.age,
-            speed=self.speed,
-            energy=self.energy,
-            size=self.size,
+            age=phenotype.age,
+            speed=phenotype.speed,
+            energy=phenotype.energy,
+            size=phenotype.size,
         )
         return self._dto
 
     def update_from_state(self, state: BeanState) -> BeanState:
         """Apply values from a `BeanState` DTO to this bean's phenotype.
 
+        When ``state`` is this bean's own DTO (as returned by `to_state`), it
+        already matches the updated phenotype and is returned as is.
+
         Raises:
             ValueError: if the DTO `id` doesn't match this bean's id.
 
@@ -212,17 +234,23 @@ class Bean:
             logger.warning(f">>> Bean {self.id} update_from_state called on dead bean. No update performed.")
             return
 
-        logger.debug(
-            f">>>>> Bean {self.id} update_from_state: before update"
-            f" phenotype={extract_phenotype_values(self._phenotype)},"
-            f" state={{age:{state.age}"
-            f" speed:{state.speed:.2f}"
-            f" energy:{state.energy:.2f}"
-            f" size:{state.size:.2f}}}"
-        )
-        self._phenotype.age = state.age
-        self._phenotype.speed = state.speed
-        self._phenotype.energy = state.energy
-        self._phenotype.size = state.size
-
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                ">>>>> Bean %s update_from_state: before update phenotype=%s,"
+                " state={age:%s speed:%.2f energy:%.2f size:%.2f}",
+                self.id,
+                extract_phenotype_values(self._phenotype),
+                state.age,
+                state.speed,
+                state.energy,
+                state.size,
+            )
+        phenotype = self._phenotype
+        phenotype.age = state.age
+        phenotype.speed = state.speed
+        phenotype.energy = state.energy
+        phenotype.size = state.size
+
+        if state is self._dto:
+            return state
         return self.to_state()
@@ -1,7 +1,7 @@
 import logging
 
 from beans.bean import BeanState
-from beans.genetics import age_speed_factor, genetic_max_speed, size_z_score
+from beans.genetics import age_speed_factor, genetic_max_speed, size_sigma
 from config.loader import BeansConfig
 
 logger = logging.getLogger(__name__)
@@ -39,7 +39,14 @@ class BeanDynamics:
         target = bean_state.target_size
         if target <= 0:
             return 1.0
-        z = size_z_score(actual, target)
+        # Most beans sit within two sigma of their target, where there is no
+        # penalty, so that band is checked before computing the z-score.
+        sigma = size_sigma(target)
+        deviation = actual - target
+        band = 2.0 * sigma
+        if -band <= deviation <= band:
+            return 1.0
+        z = deviation / sigma
         if z < -2:
             return max(0.4, 1 + z * 0.15)
         elif z > 2:
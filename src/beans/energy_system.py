@@ -15,20 +15,27 @@ energy system implementations while sharing common logic.
 import logging
 import math
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 from beans.bean import Bean, BeanState
-from beans.genetics import Gene, size_target
+from beans.genetics import size_target
 from config.loader import BeansConfig
 
 logger = logging.getLogger(__name__)
 
+# Energy systems hold no per-bean state, so one instance per (name, config) is shared.
+# Each cached system references its config, which keeps the id() in the key valid.
+_ENERGY_SYSTEM_CACHE_SIZE = 128
+_energy_system_cache: Dict[Tuple[str, int], "EnergySystem"] = {}
+
 
 class EnergySystem(ABC):
     """Abstract base class for energy system implementations.
 
     Defines the interface for energy management and provides common
-    helper methods that concrete implementations can use.
+    helper methods that concrete implementations can use. The individual
+    steps take and return plain float values, so a whole tick can run
+    without touching the bean or its state DTO between steps.
     """
 
     def __init__(self, config: BeansConfig) -> None:
@@ -51,84 +58,142 @@ class EnergySystem(ABC):
         5. Handle negative energy by burning fat
         6. Clamp size to valid range
 
+        Steps 3-5 only run when their energy condition holds, so a bean
+        at a given energy level skips the fat steps that would not apply.
+
         Args:
             bean: The bean to apply the energy system to.
 
         """
         bean_state: BeanState = bean.to_state()
+        bean_id = bean_state.id
+        energy = bean_state.energy
+        size = bean_state.size
+        fat_accumulation = bean._fat_accumulation
+
+        # Intermediate values stay local; the state DTO is written once at the end.
+        energy = self._apply_basal_metabolism(bean_id, energy, size, self._get_metabolism_factor(bean))
+        energy = self._apply_movement_cost(bean_id, energy, bean_state.speed)
+        energy_baseline = self.config.energy_baseline
+        if energy > energy_baseline:
+            energy, size = self._apply_fat_storage(bean_id, energy, size, fat_accumulation)
+        if energy < energy_baseline or energy < 0:
+            energy, size = self._apply_fat_burning(bean_id, energy, size, fat_accumulation)
+        if energy < 0:
+            energy, size = self._handle_negative_energy(bean_id, energy, size)
+        size = self._clamp_size(bean_id, size)
+
         # Set target_size every step
-        bean_state.target_size = self._calculate_target_size(bean)
+        bean_state.store(energy=energy, size=size, target_size=self._calculate_target_size(bean))
+        return bean_state
 
-        bean_state.energy = self._apply_basal_metabolism(bean_state, self._get_metabolism_factor(bean))
-        bean_state.energy = self._apply_movement_cost(bean_state)
-        bean_state.energy, bean_state.size = self._apply_fat_storage(bean_state, bean.genotype.genes[Gene.FAT_ACCUMULATION])
-        bean_state.energy, bean_state.size = self._apply_fat_burning(bean_state, bean.genotype.genes[Gene.FAT_ACCUMULATION])
-        bean_state.energy, bean_state.size = self._handle_negative_energy(bean_state)
-        bean_state.size = self._clamp_size(bean_state)
+    def apply_energy_system_batch(self, beans: List[Bean]) -> List[BeanState]:
+        """Apply the energy system mechanics to a population of beans for one update cycle.
 
-        return bean_state
+        Returns one state per bean, in the same order as ``beans``. As with
+        `apply_energy_system`, the beans themselves are not mutated; the
+        caller applies the returned states.
+
+        Args:
+            beans: The beans to apply the energy system to.
+
+        """
+        apply_energy_system = self.apply_energy_system
+        return [apply_energy_system(bean) for bean in beans]
 
     def _calculate_target_size(self, bean: Bean) -> float:
         """Calculate the target size for a bean using genotype and config."""
-        return size_target(bean.age, bean.genotype, self.config)
+        return size_target(bean.age, bean.genotype, self.config, max_age=bean._max_age)
 
 
     @abstractmethod
-    def _apply_basal_metabolism(self, bean_state: BeanState, metabolism_factor: float) -> float:
+    def _apply_basal_metabolism(self, bean_id: int, energy: float, size: float, metabolism_factor: float) -> float:
         """Apply basal metabolic cost to a bean.
 
         Args:
-            bean: The bean to apply basal metabolism to.
+            bean_id: Id of the bean, used for logging.
+            energy: Current energy.
+            size: Current size.
+            metabolism_factor: Multiplier derived from the METABOLISM_SPEED gene.
+
+        Returns:
+            The new energy.
 
         """
         ...
 
     @abstractmethod
-    def _apply_movement_cost(self, bean_state: BeanState) -> float:
+    def _apply_movement_cost(self, bean_id: int, energy: float, speed: float) -> float:
         """Apply movement cost to a bean.
 
         Args:
-            bean: The bean to apply movement cost to.
+            bean_id: Id of the bean, used for logging.
+            energy: Current energy.
+            speed: Current speed.
+
+        Returns:
+            The new energy.
 
         """
         ...
 
     @abstractmethod
-    def _apply_fat_storage(self, bean_state: BeanState, fat_accumulation: float) -> Tuple[float, float]:
+    def _apply_fat_storage(self, bean_id: int, energy: float, size: float, fat_accumulation: float) -> Tuple[float, float]:
         """Apply fat storage from energy surplus.
 
         Args:
-            bean: The bean to apply fat storage to.
+            bean_id: Id of the bean, used for logging.
+            energy: Current energy.
+            size: Current size.
+            fat_accumulation: FAT_ACCUMULATION gene value.
+
+        Returns:
+            The new (energy, size).
 
         """
         ...
 
     @abstractmethod
-    def _apply_fat_burning(self, bean_state: BeanState, fat_accumulation: float) -> Tuple[float, float]:
+    def _apply_fat_burning(self, bean_id: int, energy: float, size: float, fat_accumulation: float) -> Tuple[float, float]:
         """Apply fat burning from energy deficit.
 
         Args:
-            bean: The bean to apply fat burning to.
+            bean_id: Id of the bean, used for logging.
+            energy: Current energy.
+            size: Current size.
+            fat_accumulation: FAT_ACCUMULATION gene value.
+
+        Returns:
+            The new (energy, size).
 
         """
         ...
 
     @abstractmethod
-    def _handle_negative_energy(self, bean_state: BeanState) -> Tuple[float, float]:
+    def _handle_negative_energy(self, bean_id: int, energy: float, size: float) -> Tuple[float, float]:
         """Handle negative energy by burning fat to compensate.
 
         Args:
-            bean: The bean to handle negative energy for.
+            bean_id: Id of the bean, used for logging.
+            energy: Current energy.
+            size: Current size.
+
+        Returns:
+            The new (energy, size).
 
         """
         ...
 
     @abstractmethod
-    def _clamp_size(self, bean_state: BeanState) -> float:
+    def _clamp_size(self, bean_id: int, size: float) -> float:
         """Clamp bean size to valid range.
 
         Args:
-            bean: The bean to clamp size for.
+            bean_id: Id of the bean, used for logging.
+            size: Current size.
+
+        Returns:
+            The clamped size.
 
         """
         ...
@@ -136,7 +201,8 @@ class EnergySystem(ABC):
     def _get_metabolism_factor(self, bean: Bean) -> float:
         """Calculate metabolism factor from bean's genetics.
 
-        Returns a multiplier based on METABOLISM_SPEED gene.
+        Returns a multiplier based on METABOLISM_SPEED gene. The genotype is
+        immutable, so the bean computes it once at construction.
 
         Args:
             bean: The bean to get metabolism factor for.
@@ -145,8 +211,7 @@ class EnergySystem(ABC):
             Metabolism factor (1.0 to 1.5 based on gene value).
 
         """
-        metabolism_speed = bean.genotype.genes[Gene.METABOLISM_SPEED]
-        return 1 + 0.5 * metabolism_speed
+        return bean._metabolism_factor
 
 
 class StandardEnergySystem(EnergySystem):
@@ -158,143 +223,158 @@ class StandardEnergySystem(EnergySystem):
     """
 
 
-    def _apply_basal_metabolism(self, bean_state: BeanState, metabolism_factor: float) -> float:
+    def _apply_basal_metabolism(self, bean_id: int, energy: float, size: float, metabolism_factor: float) -> float:
         """Apply basal metabolic cost to a bean.
 
         Deducts metabolism burn from the bean's energy based on:
         burn = metabolism_base_burn * metabolism_factor * size
-        size = bean_state.size
         Higher metabolism gene and larger size increase burn rate.
-
-        Args:
-            bean: The bean to apply basal metabolism to.
-
         """
-        size = bean_state.size
-        burn = self.config.metabolism_base_burn * metabolism_factor * size
-        ret_val = bean_state.energy - burn
-        logger.debug(
-            f">>>>> Bean {bean_state.id}"
-            f" apply_basal_metabolism: size={size:.2f},"
-            f" metabolism_base_burn={self.config.metabolism_base_burn:.2f},"
-            f" metabolism_factor={metabolism_factor:.2f},"
-            f" burn={burn:.2f}"
-            f" old_energy={bean_state.energy:.2f},"
-            f" new_energy={ret_val:.2f}"
-        )
+        metabolism_base_burn = self.config.metabolism_base_burn
+        burn = metabolism_base_burn * metabolism_factor * size
+        ret_val = energy - burn
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                ">>>>> Bean %s apply_basal_metabolism: size=%.2f, metabolism_base_burn=%.2f,"
+                " metabolism_factor=%.2f, burn=%.2f old_energy=%.2f, new_energy=%.2f",
+                bean_id,
+                size,
+                metabolism_base_burn,
+                metabolism_factor,
+                burn,
+                energy,
+                ret_val,
+            )
         return ret_val
 
-    def _apply_movement_cost(self, bean_state: BeanState) -> float:
+    def _apply_movement_cost(self, bean_id: int, energy: float, speed: float) -> float:
         """Apply movement cost to a bean.
 
         Deducts energy based on absolute speed:
         cost = abs(speed) * energy_cost_per_speed
-
-        Args:
-            bean: The bean to apply movement cost to.
-
         """
-        cost = abs(bean_state.speed) * self.config.energy_cost_per_speed
-        ret_val = bean_state.energy - cost
-        logger.debug(
-            f">>>>> Bean {bean_state.id}"
-            f" apply_movement_cost: speed={bean_state.speed:.2f},"
-            f" cost={cost:.2f},"
-            f" energy_cost_per_speed={self.config.energy_cost_per_speed:.2f},"
-            f" old_energy={bean_state.energy:.2f},"
-            f" new_energy={ret_val:.2f}"
-        )
+        energy_cost_per_speed = self.config.energy_cost_per_speed
+        cost = (speed if speed >= 0.0 else -speed) * energy_cost_per_speed
+        ret_val = energy - cost
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                ">>>>> Bean %s apply_movement_cost: speed=%.2f, cost=%.2f,"
+                " energy_cost_per_speed=%.2f, old_energy=%.2f, new_energy=%.2f",
+                bean_id,
+                speed,
+                cost,
+                energy_cost_per_speed,
+                energy,
+                ret_val,
+            )
         return ret_val
 
-    def _apply_fat_storage(self, bean_state: BeanState, fat_accumulation: float) -> Tuple[float, float]:
+    def _apply_fat_storage(self, bean_id: int, energy: float, size: float, fat_accumulation: float) -> Tuple[float, float]:
         """Apply fat storage from energy surplus.
 
         When energy > energy_baseline, converts surplus to fat (size):
         fat_gain = fat_gain_rate * FAT_ACCUMULATION * surplus
         energy_cost = fat_gain * energy_to_fat_ratio
-
-        Args:
-            bean: The bean to apply fat storage to.
-
         """
-        surplus = bean_state.energy - self.config.energy_baseline
+        config = self.config
+        surplus = energy - config.energy_baseline
         if surplus <= 0:
-            return bean_state.energy, bean_state.size
+            return energy, size
 
-        fat_gain = self.config.fat_gain_rate * fat_accumulation * surplus
-        energy_cost = fat_gain * self.config.energy_to_fat_ratio
+        fat_gain = config.fat_gain_rate * fat_accumulation * surplus
+        energy_cost = fat_gain * config.energy_to_fat_ratio
 
-        phenotype_size = bean_state.size + fat_gain
-        phenotype_energy = bean_state.energy - energy_cost
+        phenotype_size = size + fat_gain
+        phenotype_energy = energy - energy_cost
         logger.debug(
-            f">>>>> Bean {bean_state.id}"
-            f" apply_fat_storage:"
-            f" surplus={surplus:.2f},"
-            f" fat_gain={fat_gain:.2f}"
-            f" old_energy={bean_state.energy:.2f}"
-            f" new_energy={phenotype_energy:.2f}"
-            f" energy_cost={energy_cost:.2f}"
-            f" old_size={bean_state.size:.2f}"
-            f" new_size={phenotype_size:.2f}"
-        )
-        return (phenotype_energy, phenotype_size)
-
-    def _apply_fat_burning(self, bean_state: BeanState, fat_accumulation: float) -> Tuple[float, float]:
-        """Apply fat burning from energy deficit or overdrawn state, using a helper for calculation."""
-        fat_burned, log_info = self._calculate_fat_burned(bean_state, fat_accumulation)
-        energy_gain = fat_burned * self.config.fat_to_energy_ratio
-        phenotype_size = bean_state.size - fat_burned
-        phenotype_energy = bean_state.energy + energy_gain
-        logger.debug(
-            ">>>>> Bean %s apply_fat_burning: %s old_size=%.2f, new_size=%.2f, old_energy=%.2f, new_energy=%.2f",
-            bean_state.id,
-            log_info,
-            bean_state.size,
-            phenotype_size,
-            bean_state.energy,
+            ">>>>> Bean %s apply_fat_storage: surplus=%.2f, fat_gain=%.2f old_energy=%.2f"
+            " new_energy=%.2f energy_cost=%.2f old_size=%.2f new_size=%.2f",
+            bean_id,
+            surplus,
+            fat_gain,
+            energy,
             phenotype_energy,
+            energy_cost,
+            size,
+            phenotype_size,
         )
         return (phenotype_energy, phenotype_size)
 
-    def _calculate_fat_burned(self, bean_state: BeanState, fat_accumulation: float) -> Tuple[float, str]:
-        """Helper to calculate fat burned and return a log info string for _apply_fat_burning."""
-        deficit = self.config.energy_baseline - bean_state.energy
-        available_fat = max(0.0, bean_state.size - self.config.min_bean_size)
+    def _apply_fat_burning(self, bean_id: int, energy: float, size: float, fat_accumulation: float) -> Tuple[float, float]:
+        """Apply fat burning from energy deficit or overdrawn state.
+
+        Below energy_baseline, burns fat proportionally to the deficit:
+        fat_burned = min(fat_burn_rate * FAT_ACCUMULATION * deficit, available_fat)
+        When overdrawn (energy < 0), burns a logarithmically growing fraction
+        (up to 20%) of the available fat. Burned fat is converted back to
+        energy with fat_to_energy_ratio.
+        """
+        config = self.config
+        deficit = config.energy_baseline - energy
+        if deficit <= 0 and energy >= 0:
+            return (energy, size)
+
+        available_fat = size - config.min_bean_size
+        if available_fat < 0.0:
+            available_fat = 0.0
         if deficit > 0:
-            fat_burned = self.config.fat_burn_rate * fat_accumulation * deficit
-            fat_burned = min(fat_burned, available_fat)
-            log_info = (f"deficit={deficit:.2f}, available_fat={available_fat:.2f}, fat_burned={fat_burned:.2f} (normal)")
-            return fat_burned, log_info
-        elif bean_state.energy < 0:
-            log_factor = math.log1p(-bean_state.energy) if bean_state.energy < 0 else 0.0
+            fat_burned = config.fat_burn_rate * fat_accumulation * deficit
+            if fat_burned > available_fat:
+                fat_burned = available_fat
+            logger.debug(
+                ">>>>> Bean %s apply_fat_burning: deficit=%.2f, available_fat=%.2f, fat_burned=%.2f (normal)",
+                bean_id,
+                deficit,
+                available_fat,
+                fat_burned,
+            )
+        else:
+            log_factor = math.log1p(-energy)
             max_burn_frac = 0.2
             burn_frac = max_burn_frac * (1.0 - 1.0 / (1.0 + log_factor)) if log_factor > 0 else 0.0
             fat_burned = available_fat * burn_frac
-            log_info = (f"energy={bean_state.energy:.2f}, available_fat={available_fat:.2f}, log_factor={log_factor:.4f}, burn_frac={burn_frac:.4f}, fat_burned={fat_burned:.4f} (logarithmic/overdrawn)")
-            return fat_burned, log_info
-        else:
-            return 0.0, "no deficit, no fat burned"
+            logger.debug(
+                ">>>>> Bean %s apply_fat_burning: energy=%.2f, available_fat=%.2f, log_factor=%.4f,"
+                " burn_frac=%.4f, fat_burned=%.4f (logarithmic/overdrawn)",
+                bean_id,
+                energy,
+                available_fat,
+                log_factor,
+                burn_frac,
+                fat_burned,
+            )
+
+        phenotype_size = size - fat_burned
+        phenotype_energy = energy + fat_burned * config.fat_to_energy_ratio
+        logger.debug(
+            ">>>>> Bean %s apply_fat_burning: old_size=%.2f, new_size=%.2f, old_energy=%.2f, new_energy=%.2f",
+            bean_id,
+            size,
+            phenotype_size,
+            energy,
+            phenotype_energy,
+        )
+        return (phenotype_energy, phenotype_size)
 
-    def _handle_negative_energy(self, bean_state: BeanState) -> Tuple[float, float]:
+    def _handle_negative_energy(self, bean_id: int, energy: float, size: float) -> Tuple[float, float]:
         """Handle negative energy by burning fat to compensate.
 
         When energy < 0, burns fat to bring energy back to 0:
         fat_burned = abs(energy) / fat_to_energy_ratio
-
-        Args:
-            bean: The bean to handle negative energy for.
-
         """
-        if bean_state.energy >= 0:
-            return (bean_state.energy, bean_state.size)
+        if energy >= 0:
+            return (energy, size)
 
         # Only burn available fat above minimum size
-        fat_needed = abs(bean_state.energy) / self.config.fat_to_energy_ratio
-        available_fat = max(0.0, bean_state.size - self.config.min_bean_size)
-        fat_burned = min(fat_needed, available_fat)
+        fat_to_energy_ratio = self.config.fat_to_energy_ratio
+        fat_needed = -energy / fat_to_energy_ratio  # energy < 0 here
+        available_fat = size - self.config.min_bean_size
+        if available_fat < 0.0:
+            available_fat = 0.0
+        fat_burned = fat_needed if fat_needed < available_fat else available_fat
 
-        phenotype_size = bean_state.size - fat_burned
-        phenotype_energy = bean_state.energy + fat_burned * self.config.fat_to_energy_ratio
+        phenotype_size = size - fat_burned
+        phenotype_energy = energy + fat_burned * fat_to_energy_ratio
 
         logger.debug(
             ">>>>> Bean %s handle_negative_energy: "
@@ -302,38 +382,34 @@ class StandardEnergySystem(EnergySystem):
             "fat_needed=%0.2f, "
             "fat_burned=%0.2f, "
             "new_energy=%0.2f",
-            bean_state.id,
-            bean_state.energy,
+            bean_id,
+            energy,
             fat_needed,
             fat_burned,
             phenotype_energy,
         )
         return (phenotype_energy, phenotype_size)
 
-    def _clamp_size(self, bean_state: BeanState) -> float:
+    def _clamp_size(self, bean_id: int, size: float) -> float:
         """Clamp bean size to valid range.
 
         Ensures size stays within [min_bean_size, max_bean_size].
-
-        Args:
-            bean: The bean to clamp size for.
-
         """
-        size = bean_state.size
-        if bean_state.size < self.config.min_bean_size:
-            size = self.config.min_bean_size
-        elif bean_state.size > self.config.max_bean_size:
-            size = self.config.max_bean_size
-
-        logger.debug(
-            ">>>>> Bean %s old_size=%0.2f clamp_size: clamped_size=%0.2f clamp_range=(%s, %s)",
-            bean_state.id,
-            bean_state.size,
-            size,
-            self.config.min_bean_size,
-            self.config.max_bean_size,
-        )
-        return size
+        config = self.config
+        min_bean_size = config.min_bean_size
+        max_bean_size = config.max_bean_size
+        clamped = min_bean_size if size < min_bean_size else (max_bean_size if size > max_bean_size else size)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                ">>>>> Bean %s old_size=%0.2f clamp_size: clamped_size=%0.2f clamp_range=(%s, %s)",
+                bean_id,
+                size,
+                clamped,
+                min_bean_size,
+                max_bean_size,
+            )
+        return clamped
 
     def _size_speed_penalty(self, bean: Bean) -> float:
         # size-speed penalty belongs to BeanDynamics.calculate_speed
@@ -353,11 +429,24 @@ def create_energy_system_from_name(name: str, config: BeansConfig) -> EnergySyst
     Returns:
         An EnergySystem instance.
 
+    Instances are cached per name and config object, so repeated calls with
+    the same config return the same energy system.
+
     Raises:
         ValueError: If the name is not recognized.
 
     """
+    key = ((name or "standard").lower(), id(config))
+    cached = _energy_system_cache.get(key)
+    if cached is not None:
+        return cached
+
     logger.info(f">>>> create_energy_system_from_name: name={name}")
-    if not name or name.lower() == "standard":
-        return StandardEnergySystem(config)
-    raise ValueError(f"Unknown energy system: {name}")
+    if key[0] != "standard":
+        raise ValueError(f"Unknown energy system: {name}")
+
+    if len(_energy_system_cache) >= _ENERGY_SYSTEM_CACHE_SIZE:
+        del _energy_system_cache[next(iter(_energy_system_cache))]
+    energy_system = StandardEnergySystem(config)
+    _energy_system_cache[key] = energy_system
+    return energy_system
@@ -3,7 +3,7 @@ import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, Set, Tuple
+from typing import Any, Dict, Mapping, Set, Tuple
 
 from config.loader import EnvironmentConfig, WorldConfig
 
@@ -41,7 +41,7 @@ class FoodManager(ABC):
         pass
 
     @abstractmethod
-    def get_all_food(self) -> Dict[Tuple[int, int], Dict[FoodType, float]]:
+    def get_all_food(self) -> Mapping[Tuple[int, int], Mapping[str, Any]]:
         pass
 
 class HybridFoodManager(FoodManager):
@@ -71,7 +71,8 @@ class HybridFoodManager(FoodManager):
         """Return the current total food energy in the world (all types)."""
         return sum(entry['value'] for entry in self.grid.values())
 
-    def _determine_food_spawn(self) -> tuple[int, float]:
+    def _determine_food_spawn(self) -> tuple[int, float, float]:
+        """Return (food_count, total_energy, current_total_energy) for this round's spawn."""
         density = self.env_config.food_density
         energy_per_food = self.env_config.food_quality
         width = self.world_config.width
@@ -86,39 +87,48 @@ class HybridFoodManager(FoodManager):
         energy_to_spawn = max(0.0, target_total_energy - current_total_energy)
         food_count = int(energy_to_spawn // energy_per_food)
         total_energy = food_count * energy_per_food
-        logger.debug(f"Spawning {food_count} "
-                    f"max_total_energy={max_total_energy} "
-                    f"target_total_energy={target_total_energy} "
-                    f"current_total_energy={current_total_energy} "
-                    f"energy_to_spawn={energy_to_spawn} "
-                    f"food_count={food_count} "
-                    f"food items totaling={total_energy} "
-                    f"energy_per_food={energy_per_food} "
-                    f"density={density} "
-                )
-        return food_count, total_energy
+        logger.debug(
+            ">>>>> HybridFoodManager::_determine_food_spawn: Spawning %s max_total_energy=%s target_total_energy=%s"
+            " current_total_energy=%s energy_to_spawn=%s food_count=%s food items totaling=%s energy_per_food=%s density=%s",
+            food_count,
+            max_total_energy,
+            target_total_energy,
+            current_total_energy,
+            energy_to_spawn,
+            food_count,
+            total_energy,
+            energy_per_food,
+            density,
+        )
+        return food_count, total_energy, current_total_energy
 
 
     def _spawn_food(self, occupied_positions: Set[Tuple[int, int]]) -> None:
-        max_count, max_energy = self._determine_food_spawn()
-        current_energy = self._current_total_food_energy()
+        # The grid does not change between these two reads, so reuse the total
+        max_count, max_energy, current_energy = self._determine_food_spawn()
         allowed_energy = max(0.0, max_energy - current_energy)
         if allowed_energy <= 0:
-            logger.debug(f">>>> HybridFoodManager::spawn_food: No food spawned, world at or above max food energy. "
-                         f"max_energy={max_energy} "
-                         f"current_energy={current_energy}"
-                         f"Allowed_energy={allowed_energy} "
-                         f"max_count={max_count}")
+            logger.debug(
+                ">>>>> HybridFoodManager::spawn_food: No food spawned, world at or above max food energy."
+                " max_energy=%s current_energy=%s allowed_energy=%s max_count=%s",
+                max_energy,
+                current_energy,
+                allowed_energy,
+                max_count,
+            )
             return
 
         energy_per_food = self.env_config.food_quality
         food_count = int(allowed_energy // energy_per_food)
         if food_count <= 0:
-            logger.debug(f">>>> HybridFoodManager::spawn_food: No food spawned, not enough room for a single food item. "
-                         f"max_count={max_count} "
-                         f"allowed_energy={allowed_energy} "
-                         f"energy_per_food={energy_per_food} "
-                         f"food_count={food_count}")
+            logger.debug(
+                ">>>>> HybridFoodManager::spawn_food: No food spawned, not enough room for a single food item."
+                " max_count=%s allowed_energy=%s energy_per_food=%s food_count=%s",
+                max_count,
+                allowed_energy,
+                energy_per_food,
+                food_count,
+            )
             return
 
         self.total_food_energy = food_count * energy_per_food
@@ -131,11 +141,11 @@ class HybridFoodManager(FoodManager):
             raise ValueError(f"Unknown food spawn distribution: {distribution}")
 
         logger.debug(
-            ">>>>> HybridFoodManager::_spawn_food: Food spawned:",
-            f"food_pixels={len(self.grid)}",
-            f"total_energy={self.total_food_energy}",
-            f"occupied_positions={len(occupied_positions)}",
-            f"food_count={food_count}"
+            ">>>>> HybridFoodManager::_spawn_food: Food spawned: food_pixels=%s total_energy=%s occupied_positions=%s food_count=%s",
+            len(self.grid),
+            self.total_food_energy,
+            len(occupied_positions),
+            food_count,
         )
 
     def _spawn_food_random(self, occupied_positions: Set[Tuple[int, int]], num_to_spawn: int) -> None:
@@ -184,19 +194,26 @@ class HybridFoodManager(FoodManager):
 
     def step(self) -> FoodManagerState:
         # Decay food by type
+        grid = self.grid
+        common = FoodType.COMMON
+        dead_bean = FoodType.DEAD_BEAN
         to_remove = []
-        for pos, entry in self.grid.items():
-            if entry['type'] == FoodType.COMMON:
-                entry['value'] *= 0.9
-                if entry['value'] < 1e-6:
+        for pos, entry in grid.items():
+            food_type = entry['type']
+            if food_type is common:
+                value = entry['value'] * 0.9
+                entry['value'] = value
+                if value < 1e-6:
                     to_remove.append(pos)
-            elif entry['type'] == FoodType.DEAD_BEAN:
-                entry['value'] *= 0.5
-                entry['rounds'] = entry.get('rounds', 0) + 1
-                if entry['rounds'] >= 3 or entry['value'] < 1e-6:
+            elif food_type is dead_bean:
+                value = entry['value'] * 0.5
+                entry['value'] = value
+                rounds = entry.get('rounds', 0) + 1
+                entry['rounds'] = rounds
+                if rounds >= 3 or value < 1e-6:
                     to_remove.append(pos)
         for pos in to_remove:
-            del self.grid[pos]
+            del grid[pos]
         # Spawn food after decay
         self._spawn_food(set())
         self.food_manager_state.total_food_energy = self._current_total_food_energy()
@@ -209,16 +226,16 @@ class HybridFoodManager(FoodManager):
             self.grid[position]['value'] += size
             self.grid[position]['rounds'] = 0
             logger.debug(
-                ">>>>> HybridFoodManager::add_dead_bean_as_food: Increased dead bean food:",
-                f"position={position}",
-                f"added_value={size}"
+                ">>>>> HybridFoodManager::add_dead_bean_as_food: Increased dead bean food: position=%s added_value=%s",
+                position,
+                size,
             )
         else:
             self.grid[position] = {'value': size, 'type': FoodType.DEAD_BEAN, 'rounds': 0}
             logger.debug(
-                ">>>>> HybridFoodManager::add_dead_bean_as_food: Added dead bean food:",
-                f"position={position}",
-                f"value={size}"
+                ">>>>> HybridFoodManager::add_dead_bean_as_food: Added dead bean food: position=%s value=%s",
+                position,
+                size,
             )
 
     def get_food_at(self, position: Tuple[int, int]) -> Dict[FoodType, float]:
@@ -229,9 +246,13 @@ class HybridFoodManager(FoodManager):
             result[entry['type']] = entry['value']
         return result
 
-    def get_all_food(self) -> Dict[Tuple[int, int], Dict[str, float]]:
-        ret_val = { pos: {'type': entry['type'], 'value': entry['value']} for pos, entry in self.grid.items() if entry['value'] > 0 }
-        return ret_val
+    def get_all_food(self) -> Mapping[Tuple[int, int], Mapping[str, Any]]:
+        """Return the grid entries that still hold food, keyed by cell.
+
+        The entries are the grid's own dicts, not copies, so the result is
+        read-only: mutating an entry changes the simulation state.
+        """
+        return {pos: entry for pos, entry in self.grid.items() if entry["value"] > 0}
 
 def create_food_manager_from_name(env_config: WorldConfig, world_config: WorldConfig) -> FoodManager:
     name = env_config.food_manager.lower()
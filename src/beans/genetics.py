@@ -14,14 +14,19 @@ import math
 import random
 from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import NamedTuple, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
 
 from config.loader import BeansConfig
 
 logger = logging.getLogger(__name__)
 
+# Approximate peak of the lifecycle curve (reached around x=0.25), stored as
+# its reciprocal so age_energy_efficiency multiplies instead of dividing.
+_INVERSE_EFFICIENCY_PEAK = 1.0 / 0.09
+
 
 # =============================================================================
 # Helper Functions
@@ -39,6 +44,10 @@ def size_z_score(size: float, target: float) -> float:
     return (size - target) / sigma if sigma else 0.0
 
 
+_AGE_CURVE_STEEPNESS = 5.0  # Steepness of the logarithmic age curve
+_AGE_CURVE_LOG_NORM = math.log(1 + _AGE_CURVE_STEEPNESS)  # Normalizes the curve so raw 1.0 maps to 1.0
+
+
 def apply_age_gene_curve(raw_value: float) -> float:
     """Apply logarithmic curve to MAX_GENETIC_AGE gene value.
 
@@ -49,9 +58,9 @@ def apply_age_gene_curve(raw_value: float) -> float:
     - raw 1.0 → 1.0 (full lifespan)
     """
     min_fraction = 0.1  # Minimum 10% lifespan even with gene=0
-    k = 5.0  # Steepness of logarithmic curve
+    k = _AGE_CURVE_STEEPNESS
 
-    log_factor = math.log(1 + k * raw_value) / math.log(1 + k)
+    log_factor = math.log(1 + k * raw_value) / _AGE_CURVE_LOG_NORM
     return min_fraction + (1 - min_fraction) * log_factor
 
 
@@ -64,7 +73,8 @@ def age_speed_factor(age: float, max_age: float, min_speed_factor: float = 0.0)
     if age <= 0:
         return min_speed_factor
 
-    x = min(max(age / max_age, 0.0), 1.0)
+    x = age / max_age
+    x = 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
 
     # shape parameters
     p = 2.0  # childhood growth rate
@@ -74,8 +84,8 @@ def age_speed_factor(age: float, max_age: float, min_speed_factor: float = 0.0)
     growth = (x**p) * math.exp(-q * x)
     aging = 1 - x**r
 
-    raw = max(0.0, growth * aging)
-    return max(min_speed_factor, raw)
+    raw = growth * aging
+    return raw if raw > min_speed_factor else min_speed_factor
 
 
 def age_energy_efficiency(age: float, max_age: float, min_efficiency: float) -> float:
@@ -88,28 +98,20 @@ def age_energy_efficiency(age: float, max_age: float, min_efficiency: float) ->
     - Peak efficiency (~1.0) at maturity
     - Declines in old age but never below min_efficiency
 
-    Uses similar curve shape to age_speed_factor.
+    Uses the same curve shape as age_speed_factor (p=2, q=2, r=4), written
+    with plain multiplications since this runs per bean per step.
     """
     if max_age <= 0:
         return min_efficiency
 
     x = min(max(age / max_age, 0.0), 1.0)
 
-    # shape parameters (similar to age_speed_factor)
-    p = 2.0  # childhood growth rate
-    q = 2.0  # maturity steepness
-    r = 4.0  # aging decay strength
-
-    growth = (x**p) * math.exp(-q * x)
-    aging = 1 - x**r
+    # growth = x^2 * e^(-2x), aging = 1 - x^4; both are >= 0 on [0, 1]
+    x_squared = x * x
+    raw_efficiency = x_squared * math.exp(-2.0 * x) * (1.0 - x_squared * x_squared)
 
-    raw_efficiency = max(0.0, growth * aging)
-
-    # Scale to range [min_efficiency, 1.0]
     # Normalize raw_efficiency (which peaks around 0.09) to [0, 1]
-    # age_speed_factor peaks around x=0.25 with value ~0.09
-    peak_value = 0.09  # approximate peak of the curve
-    normalized = min(raw_efficiency / peak_value, 1.0)
+    normalized = min(raw_efficiency * _INVERSE_EFFICIENCY_PEAK, 1.0)
 
     return min_efficiency + (1.0 - min_efficiency) * normalized
 
@@ -120,8 +122,9 @@ def age_energy_efficiency(age: float, max_age: float, min_efficiency: float) ->
 
 
 class GeneInfo(NamedTuple):
-    """Gene metadata: name and valid range."""
+    """Gene metadata: position in the genotype, name and valid range."""
 
+    index: int
     name: str
     min: float
     max: float
@@ -138,38 +141,67 @@ class Gene(Enum):
     - MAX_GENETIC_AGE: Maximum age a bean can reach genetically
     """
 
-    METABOLISM_SPEED = GeneInfo("metabolism_speed", 0.0, 1.0)
-    MAX_GENETIC_SPEED = GeneInfo("max_genetic_speed", 0.0, 1.0)
-    FAT_ACCUMULATION = GeneInfo("fat_accumulation", 0.0, 1.0)
-    MAX_GENETIC_AGE = GeneInfo("max_genetic_age", 0.0, 1.0)
-
-    @property
-    def min(self) -> float:
-        return self.value.min
+    METABOLISM_SPEED = GeneInfo(0, "metabolism_speed", 0.0, 1.0)
+    MAX_GENETIC_SPEED = GeneInfo(1, "max_genetic_speed", 0.0, 1.0)
+    FAT_ACCUMULATION = GeneInfo(2, "fat_accumulation", 0.0, 1.0)
+    MAX_GENETIC_AGE = GeneInfo(3, "max_genetic_age", 0.0, 1.0)
 
-    @property
-    def max(self) -> float:
-        return self.value.max
+    def __init__(self, index: int, gene_name: str, min_value: float, max_value: float) -> None:
+        # Plain member attributes: Gene.value is a descriptor, and these are read per bean per tick.
+        self.index = index
+        self.min = min_value
+        self.max = max_value
 
 
 class Genotype(BaseModel):
-    """Immutable genetic blueprint for a bean."""
+    """Immutable genetic blueprint for a bean.
+
+    Gene values are stored as a fixed-order tuple indexed by ``Gene.index``,
+    so reading a gene is a tuple index instead of a dict lookup. The
+    ``genes={Gene: value}`` constructor form and the ``genes`` mapping are
+    kept for callers that work with named genes.
+    """
 
-    genes: dict[Gene, float]
+    values: tuple[float, ...]
+    _genes: dict[Gene, float] = PrivateAttr()
 
     model_config = {"frozen": True}
 
-    @field_validator("genes")
+    def model_post_init(self, __context: Any) -> None:
+        self._genes = dict(zip(Gene, self.values))
+
+    @model_validator(mode="before")
     @classmethod
-    def validate_genes(cls, v: dict[Gene, float]) -> dict[Gene, float]:
+    def genes_to_values(cls, data: Any) -> Any:
+        """Convert the ``genes`` mapping form into the ordered ``values`` tuple."""
+        if "genes" not in data:
+            return data
+        genes = data["genes"]
         for gene in Gene:
-            if gene not in v:
+            if gene not in genes:
                 raise ValueError(f"Missing gene: {gene.name}")
-            value = v[gene]
+        return {"values": tuple(genes[gene] for gene in Gene)}
+
+    @field_validator("values")
+    @classmethod
+    def validate_values(cls, v: tuple[float, ...]) -> tuple[float, ...]:
+        if len(v) != len(Gene):
+            raise ValueError(f"Expected {len(Gene)} gene values, got {len(v)}")
+        for gene in Gene:
+            value = v[gene.index]
             if not gene.min <= value <= gene.max:
                 raise ValueError(f"Gene {gene.name} value {value} out of range [{gene.min}, {gene.max}]")
         return v
 
+    def __getitem__(self, gene: Gene) -> float:
+        """Return the value of `gene` by its tuple index."""
+        return self.values[gene.index]
+
+    @property
+    def genes(self) -> Mapping[Gene, float]:
+        """Return a read-only view of gene values keyed by ``Gene``."""
+        return MappingProxyType(self._genes)
+
     def to_compact_str(self) -> str:
         """Return compact string for logging: {MET:0.32, SPD:0.75, FAT:0.36, AGE:0.05}."""
         abbrev = {
@@ -178,11 +210,11 @@ class Genotype(BaseModel):
             Gene.FAT_ACCUMULATION: "FAT",
             Gene.MAX_GENETIC_AGE: "AGE",
         }
-        parts = [f"{abbrev[g]}:{v:.2f}" for g, v in self.genes.items()]
+        parts = [f"{abbrev[g]}:{v:.2f}" for g, v in zip(Gene, self.values)]
         return "{" + ", ".join(parts) + "}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Phenotype:
     """Mutable expression of genetic traits that change over time.
 
@@ -226,19 +258,22 @@ def genetic_max_age(config: BeansConfig, genotype: Genotype) -> float:
     The gene value is already transformed via apply_age_gene_curve() at
     genotype creation, so this is a simple multiplication.
     """
-    return config.max_age_rounds * genotype.genes[Gene.MAX_GENETIC_AGE]
+    return config.max_age_rounds * genotype[Gene.MAX_GENETIC_AGE]
 
 
-def size_target(age: float, genotype: Genotype, config: BeansConfig) -> float:
+def size_target(age: float, genotype: Genotype, config: BeansConfig, max_age: Optional[float] = None) -> float:
     """Calculate target size based on age and genotype.
 
-    Uses a bell curve centered at mid-life to model size changes.
+    Uses a bell curve centered at mid-life to model size changes. Callers that
+    already hold the bean's genetic max age can pass it as ``max_age``.
     """
-    max_age = genetic_max_age(config, genotype)
-    x = min(max(age / max_age, 0), 1)
+    if max_age is None:
+        max_age = genetic_max_age(config, genotype)
+    x = age / max_age
+    x = 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
 
     Smin = config.min_bean_size
-    Smax = config.max_bean_size * genotype.genes[Gene.FAT_ACCUMULATION]
+    Smax = config.max_bean_size * genotype[Gene.FAT_ACCUMULATION]
 
     k = 5.0  # width of life bell curve
 
@@ -246,9 +281,14 @@ def size_target(age: float, genotype: Genotype, config: BeansConfig) -> float:
     return Smin + (Smax - Smin) * bell
 
 
+def metabolism_factor(genotype: Genotype) -> float:
+    """Calculate the basal burn multiplier from the METABOLISM_SPEED gene (1.0 to 1.5)."""
+    return 1 + 0.5 * genotype[Gene.METABOLISM_SPEED]
+
+
 def genetic_max_speed(config: BeansConfig, genotype: Genotype) -> float:
     """Calculate maximum speed from config and genotype."""
-    return config.speed_max * genotype.genes[Gene.MAX_GENETIC_SPEED]
+    return config.speed_max * genotype[Gene.MAX_GENETIC_SPEED]
 
 
 # =============================================================================
@@ -256,22 +296,27 @@ def genetic_max_speed(config: BeansConfig, genotype: Genotype) -> float:
 # =============================================================================
 
 
+# Newborn movement direction; a tuple so create_phenotype does not build a list per bean.
+_SPEED_DIRECTIONS = (-1, 1)
+
+# (min, max - min) per gene in genotype order; lo + span * random() is exactly
+# what random.uniform(min, max) computes, minus the extra call per gene.
+_GENE_RANGES = tuple((gene.min, gene.max - gene.min) for gene in Gene)
+
+
 def create_random_genotype(rng: Optional[random.Random] = None) -> Genotype:
     """Create a genotype with random values within each gene's valid range.
 
     MAX_GENETIC_AGE uses a logarithmic curve to favor longevity.
     """
-    genes = {}
-    r = rng if rng is not None else random
-    for gene in Gene:
-        raw_value = r.uniform(gene.min, gene.max)
-        if gene == Gene.MAX_GENETIC_AGE:
-            genes[gene] = apply_age_gene_curve(raw_value)
-        else:
-            genes[gene] = raw_value
-
-    genotype = Genotype(genes=genes)
-    logger.debug(f">>>>> genetics::create_random_genotype: created genotype with genes={genes}")
+    rand = (rng if rng is not None else random).random
+    values = [lo + span * rand() for lo, span in _GENE_RANGES]
+    age_index = Gene.MAX_GENETIC_AGE.index
+    values[age_index] = apply_age_gene_curve(values[age_index])
+
+    genotype = Genotype(values=tuple(values))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(">>>>> genetics::create_random_genotype: created genotype with genes=%s", genotype.to_compact_str())
     return genotype
 
 
@@ -279,10 +324,11 @@ def create_phenotype(config: BeansConfig, genotype: Genotype, rng: Optional[rand
     """Create initial phenotype from config and genotype.
 
     Newborn beans start with age=0 and speed=0 (since age_speed_factor(0) = 0).
-    Initial values have ±5% random variation.
+    Initial values have ±5% random variation, so every call consumes ``rng``
+    and results must not be cached per genotype.
     """
-    max_age = config.max_age_rounds * genotype.genes[Gene.MAX_GENETIC_AGE]
-    max_speed = config.speed_max * genotype.genes[Gene.MAX_GENETIC_SPEED]
+    max_age = genetic_max_age(config, genotype)
+    max_speed = genetic_max_speed(config, genotype)
 
     r = rng if rng is not None else random
     initial_speed = max_speed * age_speed_factor(0, max_age, 0.0)
@@ -291,10 +337,10 @@ def create_phenotype(config: BeansConfig, genotype: Genotype, rng: Optional[rand
 
     phenotype = Phenotype(
         age=0.0,
-        speed=r.choice([-1, 1]) * initial_speed * r.uniform(random_low_bound, random_high_bound),
+        speed=r.choice(_SPEED_DIRECTIONS) * initial_speed * r.uniform(random_low_bound, random_high_bound),
         energy=config.initial_energy * r.uniform(random_low_bound, random_high_bound),
         size=float(config.initial_bean_size) * r.uniform(random_low_bound, random_high_bound),
-        target_size=size_target(0.0, genotype, config),
+        target_size=size_target(0.0, genotype, config, max_age=max_age),
     )
     msg = (
         ">>>>> genetics::create_phenotype: created phenotype age=%0.2f, speed_base=%0.2f, speed=%0.2f, energy=%0.2f, "
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import logging
-import math
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +12,8 @@ PIXEL_DISTANCE = 1  # Minimum distance in pixels between sprites to avoid overla
 class PlacementValidator:
     """Abstract base class for placement validation strategies."""
 
+    __slots__ = ()
+
     def mark_placed(self, x: float, y: float, size: int) -> None:
         """Mark a position as occupied after successful placement."""
         raise NotImplementedError()
@@ -25,6 +26,11 @@ class PlacementValidator:
         """Check if world is saturated and no more placements are feasible."""
         raise NotImplementedError()
 
+    def mark_failed_and_check(self) -> bool:
+        """Track a failed placement attempt and return whether the world is now saturated."""
+        self.mark_failed()
+        return self.is_saturated()
+
     def reset(self) -> None:
         """Reset validator state."""
         raise NotImplementedError()
@@ -33,30 +39,56 @@ class PlacementValidator:
 class ConsecutiveFailureValidator(PlacementValidator):
     """Detects saturation by tracking consecutive failed placement attempts."""
 
+    __slots__ = ("threshold", "consecutive_failures", "saturated")
+
     def __init__(self, threshold: int = 3) -> None:
         self.threshold = threshold
         self.consecutive_failures = 0
+        # Kept in step with consecutive_failures so hot callers can read it directly
+        self.saturated = threshold <= 0
 
     def mark_placed(self, x: float, y: float, size: int) -> None:
         """Reset failure counter on successful placement."""
         self.consecutive_failures = 0
+        self.saturated = self.threshold <= 0
 
     def mark_failed(self) -> None:
         """Increment failure counter."""
         self.consecutive_failures += 1
+        self.saturated = self.consecutive_failures >= self.threshold
+
+    def mark_failed_and_check(self) -> bool:
+        """Increment failure counter and return whether the threshold is reached."""
+        self.consecutive_failures += 1
+        self.saturated = self.consecutive_failures >= self.threshold
+        return self.saturated
 
     def is_saturated(self) -> bool:
         """Return True if consecutive failures exceed threshold."""
-        return self.consecutive_failures >= self.threshold
+        return self.saturated
 
     def reset(self) -> None:
         """Reset failure counter."""
         self.consecutive_failures = 0
+        self.saturated = self.threshold <= 0
 
 
 class SpaceAvailabilityValidator(PlacementValidator):
     """Tracks occupied space using bitset; detects saturation by analyzing remaining free space."""
 
+    __slots__ = (
+        "width",
+        "height",
+        "cell_size",
+        "grid_width",
+        "grid_height",
+        "total_cells",
+        "_last_col",
+        "_last_row",
+        "rows",
+        "occupied_count",
+    )
+
     def __init__(self, width: int, height: int, cell_size: int = 1) -> None:
         self.width = width
         self.height = height
@@ -64,46 +96,35 @@ class SpaceAvailabilityValidator(PlacementValidator):
         self.grid_width = (width + cell_size - 1) // cell_size
         self.grid_height = (height + cell_size - 1) // cell_size
         self.total_cells = self.grid_width * self.grid_height
-        # Bitset: use bytearray for efficient bit storage (8 bits per byte)
-        self.bitmap = bytearray((self.total_cells + 7) // 8)
+        # Highest valid column/row index, used to clamp every footprint
+        self._last_col = self.grid_width - 1
+        self._last_row = self.grid_height - 1
+        # Bitset: one int per grid row, bit i set when column i is occupied
+        self.rows = [0] * self.grid_height
         self.occupied_count = 0
 
-    def _get_cell_index(self, grid_x: int, grid_y: int) -> int:
-        """Convert grid coordinates to linear cell index."""
-        return grid_y * self.grid_width + grid_x
-
-    def _set_bit(self, cell_index: int) -> bool:
-        """Set bit at cell_index. Returns True if bit was already set."""
-        byte_index = cell_index // 8
-        bit_index = cell_index % 8
-        byte_val = self.bitmap[byte_index]
-        bit_was_set = (byte_val >> bit_index) & 1
-        self.bitmap[byte_index] |= 1 << bit_index
-        if not bit_was_set:
-            self.occupied_count += 1
-        return bit_was_set
-
-    def _get_cells(self, x: float, y: float, size: int) -> list[int]:
-        """Get all grid cell indices occupied by a circle at (x, y) with given size."""
-        cells = []
-        radius = size / 2  # size is diameter, so radius is half
-        x_min = max(0, int((x - radius) // self.cell_size))
-        x_max = min(self.grid_width - 1, int((x + radius) // self.cell_size))
-        y_min = max(0, int((y - radius) // self.cell_size))
-        y_max = min(self.grid_height - 1, int((y + radius) // self.cell_size))
+    def mark_placed(self, x: float, y: float, size: int) -> None:
+        """Mark cells occupied by placed bean using bitset.
 
+        Each grid row of the bean's footprint is a contiguous run of bits, so
+        it is ORed into that row's int in one step.
+        """
+        radius = size / 2  # size is diameter, so radius is half
+        cell_size = self.cell_size
+        x_min = max(0, int((x - radius) // cell_size))
+        x_max = min(self._last_col, int((x + radius) // cell_size))
+        y_min = max(0, int((y - radius) // cell_size))
+        y_max = min(self._last_row, int((y + radius) // cell_size))
+        if x_max < x_min:
+            return
+        run = ((1 << (x_max - x_min + 1)) - 1) << x_min
+        rows = self.rows
+        added = 0
         for grid_y in range(y_min, y_max + 1):
-            for grid_x in range(x_min, x_max + 1):
-                cell_index = self._get_cell_index(grid_x, grid_y)
-                cells.append(cell_index)
-
-        return cells
-
-    def mark_placed(self, x: float, y: float, size: int) -> None:
-        """Mark cells occupied by placed bean using bitset."""
-        cells = self._get_cells(x, y, size)
-        for cell_index in cells:
-            self._set_bit(cell_index)
+            row = rows[grid_y]
+            added += (run & ~row).bit_count()
+            rows[grid_y] = row | run
+        self.occupied_count += added
 
     def mark_failed(self) -> None:
         """No-op for space availability validator."""
@@ -111,13 +132,12 @@ class SpaceAvailabilityValidator(PlacementValidator):
 
     def is_saturated(self) -> bool:
         """Check if less than 10% free space remains."""
-        free_cells = self.total_cells - self.occupied_count
-        free_ratio = free_cells / self.total_cells
-        return free_ratio < 0.1
+        # free / total < 0.1, kept in integers to skip the division
+        return (self.total_cells - self.occupied_count) * 10 < self.total_cells
 
     def reset(self) -> None:
-        """Clear all bits in bitmap."""
-        self.bitmap = bytearray((self.total_cells + 7) // 8)
+        """Clear all bits in bitset."""
+        self.rows = [0] * self.grid_height
         self.occupied_count = 0
 
 
@@ -141,26 +161,55 @@ class SpatialHash:
 
     def insert(self, x: float, y: float) -> None:
         """Insert a position into the spatial hash."""
-        cell = self._get_cell(x, y)
-        if cell not in self.grid:
-            self.grid[cell] = []
-        self.grid[cell].append((x, y))
+        cell_size = self.cell_size
+        self.grid.setdefault((int(x // cell_size), int(y // cell_size)), []).append((x, y))
 
     def get_neighbors(self, x: float, y: float, radius: float) -> list[tuple[float, float]]:
         """Get all positions in the 9 surrounding grid cells."""
-        cell = self._get_cell(x, y)
+        cell_size = self.cell_size
+        cx = int(x // cell_size)
+        cy = int(y // cell_size)
+        grid = self.grid
         neighbors = []
-        # Check neighboring cells
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                check_cell = (cell[0] + dx, cell[1] + dy)
-                if check_cell in self.grid:
-                    neighbors.extend(self.grid[check_cell])
+        # Check neighboring cells; one lookup per cell instead of `in` then index
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = grid.get((gx, gy))
+                if cell is not None:
+                    neighbors.extend(cell)
         return neighbors
 
+    def has_point_within(self, x: float, y: float, distance: float) -> bool:
+        """Return True if any stored position is closer than `distance` to (x, y).
+
+        Only the 9 surrounding cells are scanned, so `distance` must not exceed
+        `cell_size`. Stops at the first hit instead of collecting neighbours.
+        """
+        # Same cell as _get_cell, computed inline: this runs for every placement attempt
+        cell_size = self.cell_size
+        cx = int(x // cell_size)
+        cy = int(y // cell_size)
+        grid = self.grid
+        distance_sq = distance * distance
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = grid.get((gx, gy))
+                if cell is None:
+                    continue
+                for px, py in cell:
+                    dx = x - px
+                    # Bounding-box reject: a point outside the square cannot be in the circle
+                    if dx >= distance or -dx >= distance:
+                        continue
+                    dy = y - py
+                    if dx * dx + dy * dy < distance_sq:
+                        return True
+        return False
+
 
 class PlacementStrategy:
-    def place(self, count: int, width: int, height: int, size: int) -> List[Tuple[float, float]]:
+    def place(self, count: int, width: int, height: int, size: int, rng: Optional[random.Random] = None) -> List[Tuple[float, float]]:
+        """Return up to `count` non-overlapping positions; `rng` overrides the strategy's own generator."""
         raise NotImplementedError()
 
     @staticmethod
@@ -177,10 +226,12 @@ class PlacementStrategy:
 
 
 class RandomPlacementStrategy(PlacementStrategy):
-    def __init__(self, max_retries: int = 50) -> None:
+    def __init__(self, max_retries: int = 50, rng: Optional[random.Random] = None) -> None:
         self.max_retries = max_retries
+        # Falls back to the global random module so random.seed() keeps working
+        self._rng = rng if rng is not None else random
 
-    def place(self, count: int, width: int, height: int, size: int) -> List[Tuple[float, float]]:
+    def place(self, count: int, width: int, height: int, size: int, rng: Optional[random.Random] = None) -> List[Tuple[float, float]]:
         logger.info(f">>>>> RandomPlacementStrategy.place: count={count}, width={width}, height={height}, size={size}")
         if count <= 0:
             logger.warning(">>> Count <= 0, returning empty list")
@@ -189,33 +240,39 @@ class RandomPlacementStrategy(PlacementStrategy):
         positions: List[Tuple[float, float]] = []
         spatial_hash = SpatialHash(cell_size=size, width=width, height=height)
         validator = PlacementStrategy.consecutive_failure_validator(threshold=3)
+        # width * random() is exactly what random.uniform(0, width) computes,
+        # without the extra call layer per coordinate.
+        rand = (rng if rng is not None else self._rng).random
+        # snap_to_half_pixel inlined: doubling is exact in floating point, so
+        # round(2 * width * r) / 2 equals snap_to_half_pixel(width * r).
+        width2 = width * 2
+        height2 = height * 2
+        # Bound once: these run for every attempt of every bean
+        occupied = spatial_hash.has_point_within
+        insert = spatial_hash.insert
+        append = positions.append
+        mark_placed = validator.mark_placed
+        max_retries = self.max_retries
 
         for bean_idx in range(count):
             placed = False
-            for attempt in range(self.max_retries):
-                x = snap_to_half_pixel(random.uniform(0, width))
-                y = snap_to_half_pixel(random.uniform(0, height))
-
-                # Check for collisions with existing positions
-                neighbors = spatial_hash.get_neighbors(x, y, radius=size)
-                collision_detected = False
-                for neighbor_x, neighbor_y in neighbors:
-                    distance = math.sqrt((x - neighbor_x) ** 2 + (y - neighbor_y) ** 2)
-                    if distance < size:
-                        collision_detected = True
-                        break
-
-                if not collision_detected:
-                    positions.append((x, y))
-                    spatial_hash.insert(x, y)
-                    validator.mark_placed(x, y, size)
+            for attempt in range(max_retries):
+                x = round(width2 * rand()) / 2
+                y = round(height2 * rand()) / 2
+
+                # Half-pixel snapping keeps the squared distances exact, so
+                # this matches a sqrt-based distance comparison.
+                if not occupied(x, y, size):
+                    append((x, y))
+                    insert(x, y)
+                    mark_placed(x, y, size)
                     placed = True
                     break
 
             if not placed:
-                validator.mark_failed()
+                saturated = validator.mark_failed_and_check()
                 logger.warning(f">>> Failed to place bean {bean_idx} after {self.max_retries} attempts")
-                if validator.is_saturated():
+                if saturated:
                     logger.warning(f">>> World saturated: {len(positions)} of {count} beans placed ({len(positions)/count*100:.1f}%)")
                     break
 
@@ -223,14 +280,35 @@ class RandomPlacementStrategy(PlacementStrategy):
         return positions
 
 
-# TODO Implement strategy: GridPlacementStrategy
 class GridPlacementStrategy(PlacementStrategy):
+    """Place beans row by row on a regular grid of `size`-wide cells.
+
+    The layout is computed directly: neighbouring centres are exactly `size`
+    apart, so no collision checks are needed.
+    """
+
     def __init__(self) -> None:
         pass
 
-    def place(self, count: int, width: int, height: int, size: int) -> List[Tuple[float, float]]:
+    def place(self, count: int, width: int, height: int, size: int, rng: Optional[random.Random] = None) -> List[Tuple[float, float]]:
         logger.info(f">>>> GridPlacementStrategy.place: count={count}, width={width}, height={height}, size={size}")
-        raise NotImplementedError("GridPlacementStrategy is not yet implemented.")
+        if count <= 0:
+            logger.warning(">>> Count <= 0, returning empty list")
+            return []
+
+        cols = int(width // size)
+        rows = int(height // size)
+        capacity = cols * rows
+        if count > capacity:
+            logger.warning(f">>> Grid holds {capacity} beans, placing {capacity} of {count}")
+            count = capacity
+
+        half = size / 2
+        xs = [snap_to_half_pixel(half + i * size) for i in range(cols)]
+        positions = [(xs[idx % cols], snap_to_half_pixel(half + (idx // cols) * size)) for idx in range(count)]
+
+        logger.info(f">>>> Generated {len(positions)} positions")
+        return positions
 
 
 # TODO Implement strategy: ClusteredPlacementStrategy
@@ -238,21 +316,24 @@ class ClusteredPlacementStrategy(PlacementStrategy):
     def __init__(self) -> None:
         pass
 
-    def place(self, count: int, width: int, height: int, size: int) -> List[Tuple[float, float]]:
+    def place(self, count: int, width: int, height: int, size: int, rng: Optional[random.Random] = None) -> List[Tuple[float, float]]:
         logger.info(f">>>> ClusteredPlacementStrategy.place: count={count}, width={width}, height={height}, size={size}")
         raise NotImplementedError("ClusteredPlacementStrategy is not yet implemented.")
 
 
-def create_strategy_from_name(name: str) -> PlacementStrategy:
-    """Return a placement strategy instance given a config name string."""
+def create_strategy_from_name(name: str, rng: Optional[random.Random] = None) -> PlacementStrategy:
+    """Return a placement strategy instance given a config name string.
+
+    `rng` is handed to strategies that draw random numbers; without it they use the global random module.
+    """
     logger.info(f">>>> create_strategy_from_name: name={name}")
     match name.lower() if name else "":
         case "random":
-            return RandomPlacementStrategy()
+            return RandomPlacementStrategy(rng=rng)
         case "grid":
             return GridPlacementStrategy()
         case "clustered" | "cluster":
             return ClusteredPlacementStrategy()
         case _:
             logger.debug(f">>>>> Unknown strategy '{name}', defaulting to RandomPlacementStrategy")
-            return RandomPlacementStrategy()
+            return RandomPlacementStrategy(rng=rng)
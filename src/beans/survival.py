@@ -102,32 +102,39 @@ class DefaultSurvivalChecker(SurvivalChecker):
             )
         return None
 
-    def _check_obesity(self, bean: Bean) -> Optional[SurvivalResult]:
+    def obesity_death_probability(self, bean: Bean) -> Optional[float]:
+        """Return the per-tick obesity death probability for `bean`.
+
+        Returns None while the bean is below the obesity threshold, in which
+        case no random draw is made for it.
+        """
         config: BeansConfig = self.config
         threshold = min(config.max_bean_size, config.initial_bean_size * config.obesity_threshold_factor)
-        if bean.size >= threshold:
-            min_size = config.min_bean_size
-            max_size = config.max_bean_size
-            base_prob = config.obesity_death_probability
-            # Scale probability linearly with size
-            prob = base_prob * (bean.size - min_size) / (max_size - min_size)
-            prob = max(0.0, min(prob, base_prob))  # Clamp to [0, base_prob]
-            rng_val = self.rng.random()
-            self.logger.debug(f">>>>> Survival.check: obesity check Bean {bean.id}, "
-                              f"size={bean.size}, "
-                              f"threshold={threshold}, "
-                              f"base_prob={base_prob}, "
-                              f"prob={prob}, "
-                              f"rng={rng_val}"
-                              f"min_size={min_size}, "
-                              f"max_size={max_size} "
-                            )
-            if rng_val < prob:
-                return SurvivalResult(
-                    alive=False,
-                    reason="obesity",
-                    message="Probabilistic obesity death",
-                )
+        size = bean.size
+        if size < threshold:
+            return None
+        min_size = config.min_bean_size
+        base_prob = config.obesity_death_probability
+        # Scale probability linearly with size, clamped to [0, base_prob]
+        prob = base_prob * (size - min_size) / (config.max_bean_size - min_size)
+        return max(0.0, min(prob, base_prob))
+
+    def _check_obesity(self, bean: Bean) -> Optional[SurvivalResult]:
+        prob = self.obesity_death_probability(bean)
+        if prob is None:
+            return None
+        rng_val = self.rng.random()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                ">>>>> Survival.check: obesity check Bean %s, size=%s, base_prob=%s, prob=%s, rng=%s",
+                bean.id, bean.size, self.config.obesity_death_probability, prob, rng_val,
+            )
+        if rng_val < prob:
+            return SurvivalResult(
+                alive=False,
+                reason="obesity",
+                message="Probabilistic obesity death",
+            )
         return None
 
 
@@ -105,12 +105,19 @@ class World:
 
 
     def step(self, dt: float) -> WorldState:
-        logger.debug(f">>>>> World.step: dt={dt}, beans_count={len(self.beans)}, dead_beans_count={len(self.dead_beans)}, round={self.round}")
+        logger.debug(
+            ">>>>> World.step: dt=%s, beans_count=%s, dead_beans_count=%s, round=%s",
+            dt,
+            len(self.beans),
+            len(self.dead_beans),
+            self.round,
+        )
         self.environment_state = self.environment.step()
         survivors: List[Bean] = []
         dead_this_step: List[Bean] = []
-        for bean in self.beans:
-            _: BeanState = self._update_bean(bean)
+        bean_states = self.energy_system.apply_energy_system_batch(self.beans)
+        for bean, bean_state in zip(self.beans, bean_states):
+            self._update_bean(bean, bean_state)
             result = self.survival_manager.check_and_record(bean)
             if not result.alive:
                 logger.debug(
@@ -120,11 +127,12 @@ class World:
                     bean.sex.value,
                     bean._max_age,
                 )
-                logger.debug(
-                    "phenotype=%s, genotype=%s",
-                    extract_phenotype_values(bean._phenotype),
-                    bean.genotype.to_compact_str(),
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "phenotype=%s, genotype=%s",
+                        extract_phenotype_values(bean._phenotype),
+                        bean.genotype.to_compact_str(),
+                    )
                 dead_this_step.append(bean)
             else:
                 survivors.append(bean)
@@ -137,42 +145,43 @@ class World:
         self.state.current_round = self.round
         self.state.environment_state = self.environment_state
 
-        for bean in self.beans:
-            logger.debug(
-                ">>>>> World.step [state]. Beans State:"
-                f" Bean {bean.id} "
-                f" alive={bean.alive}"
-                f" sex={bean.sex.value}"
-                f" age={bean.age:.2f}"
-                f" energy={bean.energy:.2f}"
-                f" size={bean.size:.2f}"
-                f" target_size={bean._phenotype.target_size:.2f}"
-                f" speed={bean.speed:.2f}"
-                f" genotype={bean.genotype.to_compact_str()}"
-            )
-        logger.debug(f">>>>> World.step: [state]. FoodManagerState: "
-                    f"food_items_count={self.environment_state.food_manager_state.total_food_count} "
-                    f"total_food_energy={self.environment_state.food_manager_state.total_food_energy} "
+        # The per-bean dump formats every survivor, so only build it when DEBUG is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            for bean in self.beans:
+                logger.debug(
+                    ">>>>> World.step [state]. Beans State: Bean %s alive=%s sex=%s age=%.2f energy=%.2f"
+                    " size=%.2f target_size=%.2f speed=%.2f genotype=%s",
+                    bean.id,
+                    bean.alive,
+                    bean.sex.value,
+                    bean.age,
+                    bean.energy,
+                    bean.size,
+                    bean._phenotype.target_size,
+                    bean.speed,
+                    bean.genotype.to_compact_str(),
+                )
+        logger.debug(
+            ">>>>> World.step: [state]. FoodManagerState: food_items_count=%s total_food_energy=%s ",
+            self.environment_state.food_manager_state.total_food_count,
+            self.environment_state.food_manager_state.total_food_energy,
         )
-        logger.debug(f">>>>> World.step: [state]. EnvironmentState: "
-                     f"food manager present={self.environment_state.food_manager_state is not None} "
+        logger.debug(
+            ">>>>> World.step: [state]. EnvironmentState: food manager present=%s ",
+            self.environment_state.food_manager_state is not None,
         )
-        logger.debug(f">>>>> World.step: [state]. WorldState: "
-                     f"alive_beans={len(self.state.alive_beans)} "
-                     f"dead_beans={len(self.state.dead_beans)} "
-                     f"current_round={self.state.current_round}"
+        logger.debug(
+            ">>>>> World.step: [state]. WorldState: alive_beans=%s dead_beans=%s current_round=%s",
+            len(self.state.alive_beans),
+            len(self.state.dead_beans),
+            self.state.current_round,
         )
 
         return self.state
 
-    def _update_bean(self, bean: Bean) -> BeanState:
-        bean_state = self.energy_system.apply_energy_system(bean)
-
+    def _update_bean(self, bean: Bean, bean_state: BeanState) -> BeanState:
         speed = self.bean_dynamics.calculate_speed(bean_state, bean.genotype, bean._max_age)
-        bean_state.store(speed=speed)
-
-        age = bean.age_bean()
-        bean_state.store(age=age)
+        bean_state.store(speed=speed, age=bean.age_bean())
 
         return bean.update_from_state(bean_state)
 
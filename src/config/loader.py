@@ -1,13 +1,12 @@
 import json
 import logging
-import os
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldConfig:
     male_sprite_color: str  # Color for male bean sprites.
     female_sprite_color: str  # Color for female bean sprites.
@@ -25,8 +24,16 @@ class WorldConfig:
     seed: Optional[int] = None  # Optional seed for deterministic world RNG
 
 
-@dataclass
+@dataclass(slots=True)
 class BeansConfig:
+    """Bean parameters shared by every bean and system in a world.
+
+    One instance is shared and may be adjusted while a world runs, so
+    systems read it live rather than copying values out. Slots keep the
+    per-tick attribute reads cheap and make a misspelled field assignment
+    fail instead of silently adding an attribute.
+    """
+
     speed_min: float  # Minimum allowed bean speed (units/step).
     speed_max: float  # Maximum allowed bean speed (units/step).
     max_age_rounds: int = 1200  # Maximum bean age in simulation rounds (ticks).
@@ -69,7 +76,7 @@ class BeansConfig:
     collision_damage_sex_factors: Tuple[float, float] = (1.05, 1.0)  # (FEMALE, MALE)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentConfig:
     name: str = "default"
     cell_size: int = 20
@@ -184,14 +191,31 @@ DEFAULT_ENVIRONMENT_CONFIG = EnvironmentConfig(
 def load_config(
     config_file_path: str,
 ) -> tuple[WorldConfig, BeansConfig, EnvironmentConfig]:
-    logger.info(f">>>> load_config called with config_file_path={config_file_path}")
-    if not config_file_path or not os.path.exists(config_file_path):
-        logger.error(f">> Configuration file not found: {config_file_path}")
-        raise FileNotFoundError(f"Configuration file not found: {config_file_path}")
+    logger.info(">>>> load_config called with config_file_path=%s", config_file_path)
+    # Open directly instead of checking os.path.exists first: one filesystem
+    # round-trip per load, and no window between the check and the open.
+    try:
+        with open(config_file_path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError as e:
+        logger.error(">> Configuration file not found: %s", config_file_path)
+        raise FileNotFoundError(f"Configuration file not found: {config_file_path}") from e
+
+    return load_config_from_mapping(data)
+
+
+def load_config_from_mapping(
+    data: dict,
+) -> tuple[WorldConfig, BeansConfig, EnvironmentConfig]:
+    """Build and validate the configs from already-parsed JSON data.
+
+    `data` has the same shape as a config file: optional "world", "beans" and
+    "environment" sections, with missing keys falling back to the defaults.
 
-    with open(config_file_path, "r") as f:
-        data = json.load(f)
+    Raises:
+        ValueError: if any config value is invalid.
 
+    """
     world_data = data.get("world", {})
     beans_data = data.get("beans", {})
 
@@ -1,4 +1,5 @@
 import logging
+import math
 import random
 from typing import Optional
 
@@ -21,6 +22,8 @@ class BeanSprite(arcade.Sprite):
     ):
         direction = random.uniform(0, 360) if direction is None else direction
         self.direction = direction % 360.0
+        # (direction, cos, sin) for the last heading used; NaN never matches
+        self._heading = (math.nan, 0.0, 0.0)
         logger.debug(f">>>>> BeanSprite.__init__: bean_id={bean.id}, position={position}, color={color}, direction={self.direction:.2f}")
         self.diameter = bean.beans_config.initial_bean_size
         texture = arcade.make_circle_texture(self.diameter, color)
@@ -28,6 +31,19 @@ class BeanSprite(arcade.Sprite):
         self.bean = bean
         self.color = color
 
+    def heading_vector(self) -> tuple[float, float]:
+        """Return (cos, sin) of the current direction.
+
+        Headings only change on bounces and collisions, so the trig is
+        recomputed only when `direction` differs from the cached value.
+        """
+        direction = self.direction
+        heading = self._heading
+        if heading[0] != direction:
+            rads = math.radians(direction)
+            heading = self._heading = (direction, math.cos(rads), math.sin(rads))
+        return heading[1], heading[2]
+
     def update_from_bean(
         self,
         delta_time: float = 1.0,
@@ -39,39 +55,42 @@ class BeanSprite(arcade.Sprite):
         the sprite interpolates towards it for smoother animation.
         """
         # Save previous visual center for interpolation
-        prev_x = self.center_x
-        prev_y = self.center_y
+        prev_x, prev_y = self.position
 
         # Update visual scale from bean size
         scale_factor = self.bean.size / self.diameter
         self.scale = scale_factor
 
-        target_x = self.center_x
-        target_y = self.center_y
+        target_x = prev_x
+        target_y = prev_y
         if target_position is not None:
             target_x, target_y = target_position
 
-        # Interpolate for visual smoothing; dt controls fraction (constant multiplier)
+        # Interpolate for visual smoothing; dt controls fraction (constant multiplier).
+        # Assign both coordinates at once: each position write refreshes the hit
+        # box and every sprite list holding this sprite.
         lerp = min(1.0, delta_time * 6.0)
-        self.center_x = prev_x + (target_x - prev_x) * lerp
-        self.center_y = prev_y + (target_y - prev_y) * lerp
+        new_x = prev_x + (target_x - prev_x) * lerp
+        new_y = prev_y + (target_y - prev_y) * lerp
+        self.position = (new_x, new_y)
 
         # Orient sprite visually to the direction
         self.angle = self.direction
-        msg = (
-            ">>>>> BeanSprite.update_from_bean: bean_id=%s, prev=(%0.2f,%0.2f), target=(%0.2f,%0.2f), lerp=%0.2f, "
-            "new=(%0.2f,%0.2f), direction=%0.2f, scale=%0.2f"
-        )
-        logger.debug(
-            msg,
-            self.bean.id,
-            prev_x,
-            prev_y,
-            target_x,
-            target_y,
-            lerp,
-            self.center_x,
-            self.center_y,
-            self.direction,
-            scale_factor,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            msg = (
+                ">>>>> BeanSprite.update_from_bean: bean_id=%s, prev=(%0.2f,%0.2f), target=(%0.2f,%0.2f), lerp=%0.2f, "
+                "new=(%0.2f,%0.2f), direction=%0.2f, scale=%0.2f"
+            )
+            logger.debug(
+                msg,
+                self.bean.id,
+                prev_x,
+                prev_y,
+                target_x,
+                target_y,
+                lerp,
+                new_x,
+                new_y,
+                self.direction,
+                scale_factor,
+            )
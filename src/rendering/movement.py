@@ -1,6 +1,6 @@
 import logging
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from beans.environment.food_manager import FoodManager
 from beans.placement import SpatialHash
@@ -12,10 +12,8 @@ logger = logging.getLogger(__name__)
 
 
 def _normalize_angle(angle: float) -> float:
-    angle = angle % 360.0
-    if angle < 0:
-        angle += 360.0
-    return angle
+    # Python's float modulo takes the sign of the divisor, so this is never negative.
+    return angle % 360.0
 
 
 class SpriteMovementSystem:
@@ -39,13 +37,14 @@ class SpriteMovementSystem:
         # Use bean's speed directly as pixels per tick, scaled by config factor
         pixels_factor = bean.beans_config.pixels_per_unit_speed
         speed_px = bean.speed * pixels_factor
-        # Convert direction to radians; direction is degrees
-        rads = math.radians(sprite.direction)
-        dx = math.cos(rads) * speed_px
-        dy = math.sin(rads) * speed_px
+        direction = sprite.direction
+        cos_dir, sin_dir = sprite.heading_vector()
+        dx = cos_dir * speed_px
+        dy = sin_dir * speed_px
 
-        new_x = sprite.center_x + dx
-        new_y = sprite.center_y + dy
+        x, y = sprite.position
+        new_x = x + dx
+        new_y = y + dy
 
         radius = bean.size / 2.0
         collisions = 0
@@ -53,36 +52,48 @@ class SpriteMovementSystem:
         # Horizontal collisions
         if new_x - radius < 0:
             new_x = radius
-            sprite.direction = _normalize_angle(180.0 - sprite.direction)
+            direction = _normalize_angle(180.0 - direction)
             collisions += 1
         elif new_x + radius > bounds_width:
             new_x = bounds_width - radius
-            sprite.direction = _normalize_angle(180.0 - sprite.direction)
+            direction = _normalize_angle(180.0 - direction)
             collisions += 1
 
         # Vertical collisions
         if new_y - radius < 0:
             new_y = radius
-            sprite.direction = _normalize_angle(-sprite.direction)
+            direction = _normalize_angle(-direction)
             collisions += 1
         elif new_y + radius > bounds_height:
             new_y = bounds_height - radius
-            sprite.direction = _normalize_angle(-sprite.direction)
+            direction = _normalize_angle(-direction)
             collisions += 1
 
+        if collisions:
+            sprite.direction = direction
+
         # Do not update sprite positions directly here; return target coords so the
         # caller (sprite) can interpolate visually.
-        msg = (f">>>>> MovementSystem.move_sprite: bean={bean.id}, speed={bean.speed:.2f}, "
-            f"dx={dx:.2f}, dy={dy:.2f}, target=({new_x:.2f},{new_y:.2f}), collisions={collisions}"
-        )
-        logger.debug(msg)
-        # For each collision, deduct energy via DTO update
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                ">>>>> MovementSystem.move_sprite: bean=%s, speed=%.2f, dx=%.2f, dy=%.2f, target=(%.2f,%.2f), collisions=%s",
+                bean.id,
+                bean.speed,
+                dx,
+                dy,
+                new_x,
+                new_y,
+                collisions,
+            )
+        # For each collision, deduct energy; the DTO is written back once
         if collisions > 0:
-            loss = sprite.bean.beans_config.energy_loss_on_bounce
+            loss = bean.beans_config.energy_loss_on_bounce
+            state = bean.to_state()
+            energy = state.energy
             for _ in range(collisions):
-                state = sprite.bean.to_state()
-                state.energy -= loss
-                sprite.bean.update_from_state(state)
+                energy -= loss
+            state.store(energy=energy)
+            bean.update_from_state(state)
 
         return new_x, new_y, collisions
 
@@ -180,26 +191,21 @@ class SpriteMovementSystem:
         factor_b = female_factor if sprite_b.bean.sex.name == "FEMALE" else male_factor
         return dmg_a * factor_a, dmg_b * factor_b
 
-    def _apply_damage(
+    def _apply_collision_outcome(
         self,
-        sprite_a: BeanSprite,
-        sprite_b: BeanSprite,
-        damage_a: float,
-        damage_b: float,
+        sprite: BeanSprite,
+        damage: float,
+        new_speed: float,
+        new_dir: float,
         damage_report: Dict[int, float],
     ) -> None:
-        """Apply damage to beans via DTO and update damage report."""
-        state_a = sprite_a.bean.to_state()
-        state_a.energy -= damage_a
-        sprite_a.bean.update_from_state(state_a)
-        damage_report[sprite_a.bean.id] = damage_report.get(sprite_a.bean.id, 0.0) + damage_a
-
-        state_b = sprite_b.bean.to_state()
-        state_b.energy -= damage_b
-        sprite_b.bean.update_from_state(state_b)
-        damage_report[sprite_b.bean.id] = damage_report.get(sprite_b.bean.id, 0.0) + damage_b
-
-        logger.debug(f">>>>> Collision damage: beans=({sprite_a.bean.id},{sprite_b.bean.id}), damage=({damage_a:.3f},{damage_b:.3f})")
+        """Apply collision damage and the post-collision velocity to one bean in a single DTO update."""
+        bean = sprite.bean
+        state = bean.to_state()
+        state.store(energy=state.energy - damage, speed=new_speed)
+        bean.update_from_state(state)
+        sprite.direction = new_dir
+        damage_report[bean.id] = damage_report.get(bean.id, 0.0) + damage
 
     def _resolve_elastic_collision(
         self,
@@ -248,12 +254,11 @@ class SpriteMovementSystem:
         """Adjust positions to remove overlap after collision."""
         r0 = sprite_a.bean.size / 2.0
         r1 = sprite_b.bean.size / 2.0
-        d = math.hypot(pos_a[0] - pos_b[0], pos_a[1] - pos_b[1])
+        nx, ny = pos_a[0] - pos_b[0], pos_a[1] - pos_b[1]
+        d = math.hypot(nx, ny)
         overlap = (r0 + r1) - d
         if overlap > 0:
-            nx, ny = pos_a[0] - pos_b[0], pos_a[1] - pos_b[1]
-            nd = math.hypot(nx, ny)
-            unx, uny = (nx / nd, ny / nd) if nd > 0 else (1.0, 0.0)
+            unx, uny = (nx / d, ny / d) if d > 0 else (1.0, 0.0)
             shift_x = unx * (overlap / 2.0)
             shift_y = uny * (overlap / 2.0)
             ax, ay = adjusted[sprite_a]
@@ -261,13 +266,6 @@ class SpriteMovementSystem:
             adjusted[sprite_a] = (ax + shift_x, ay + shift_y)
             adjusted[sprite_b] = (bx - shift_x, by - shift_y)
 
-    def _update_sprite_state(self: BeanSprite, other: BeanSprite, new_speed, new_dir):
-        state = other.bean.to_state()
-        state.speed = new_speed
-        other.bean.update_from_state(state)
-        other.direction = new_dir
-
-
     def _detect_bean_collisions(self, sprite_targets, bounds_width, bounds_height):
         """Detect and resolve bean-bean collisions, returning adjusted positions and damage report."""
         adjusted: Dict[BeanSprite, Tuple[float, float]] = {sprite: (tx, ty) for sprite, tx, ty in sprite_targets}
@@ -279,51 +277,90 @@ class SpriteMovementSystem:
         handled_pairs = set()
 
         for sprite, tx, ty in sprite_targets:
-            neighbors = spatial.get_neighbors(tx, ty, radius=sprite.bean.size)
+            size = sizes[sprite]
+            neighbors = spatial.get_neighbors(tx, ty, radius=size)
             for npos in neighbors:
                 if npos == (tx, ty):
                     continue
                 other = positions_map.get(npos)
-                if not other or tuple(sorted((sprite.bean.id, other.bean.id))) in handled_pairs:
+                if not other:
+                    continue
+                # Cheap squared-distance reject before the intersection-area
+                # test: circles that do not overlap have zero intersection.
+                dx = tx - npos[0]
+                dy = ty - npos[1]
+                reach = (size + sizes[other]) / 2.0
+                if dx * dx + dy * dy >= reach * reach:
+                    continue
+                a_id = sprite.bean.id
+                b_id = other.bean.id
+                pair = (a_id, b_id) if a_id < b_id else (b_id, a_id)
+                if pair in handled_pairs:
                     continue
                 if self._detect_collision(sprite, other, (tx, ty), npos):
-                    handled_pairs.add(tuple(sorted((sprite.bean.id, other.bean.id))))
+                    handled_pairs.add(pair)
                     cfg = sprite.bean.beans_config
                     damage_a, damage_b = self._compute_collision_damage(sprite, other, (tx, ty), npos, cfg)
-                    self._apply_damage(sprite, other, damage_a, damage_b, damage_report)
                     new_speed_a, new_dir_a, new_speed_b, new_dir_b = self._resolve_elastic_collision(sprite, other, (tx, ty), npos, cfg)
-                    self._update_sprite_state(sprite, new_speed_a, new_dir_a)
-                    self._update_sprite_state(other, new_speed_b, new_dir_b)
+                    self._apply_collision_outcome(sprite, damage_a, new_speed_a, new_dir_a, damage_report)
+                    self._apply_collision_outcome(other, damage_b, new_speed_b, new_dir_b, damage_report)
 
                     self._nudge_positions(sprite, other, (tx, ty), npos, adjusted)
-                    logger.debug(f">>>>> Collision detected between "
-                                 f"bean A:{sprite.bean.id} "
-                                 f"bean B:{other.bean.id}"
-                                 f" at positions A:{(tx, ty)} B:{npos}"
-                                 f" applied damage ({damage_a:.2f}, {damage_b:.2f})"
-                                 f" old energies ({sprite.bean.energy + damage_a:.2f}, {other.bean.energy + damage_b:.2f})"
-                                 f" new energies ({sprite.bean.energy:.2f}, {other.bean.energy:.2f})"
-                                 f" new speeds ({new_speed_a:.2f}, {new_speed_b:.2f})"
-                                 f" new directions ({new_dir_a:.2f}, {new_dir_b:.2f})"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            ">>>>> Collision detected between bean A:%s bean B:%s at positions A:%s B:%s"
+                            " applied damage (%.2f, %.2f) old energies (%.2f, %.2f) new energies (%.2f, %.2f)"
+                            " new speeds (%.2f, %.2f) new directions (%.2f, %.2f)",
+                            sprite.bean.id, other.bean.id, (tx, ty), npos,
+                            damage_a, damage_b,
+                            sprite.bean.energy + damage_a, other.bean.energy + damage_b,
+                            sprite.bean.energy, other.bean.energy,
+                            new_speed_a, new_speed_b,
+                            new_dir_a, new_dir_b,
+                        )
 
         return adjusted, damage_report
 
+    def _food_candidates(self, food_items: dict, x: float, y: float, radius: float) -> Iterable[Tuple[Tuple[int, int], dict]]:
+        """Return (position, info) pairs for food that may lie within `radius` of (x, y).
+
+        Food positions are integer cells (see `FoodManager`), so when the square
+        of cells under the bean is smaller than the food map, probing those
+        cells directly beats scanning every food item.
+        """
+        x_lo, x_hi = math.ceil(x - radius), math.floor(x + radius)
+        y_lo, y_hi = math.ceil(y - radius), math.floor(y + radius)
+        if (x_hi - x_lo + 1) * (y_hi - y_lo + 1) >= len(food_items):
+            return food_items.items()
+        get_food = food_items.get
+        return [
+            (pos, info)
+            for pos in ((fx, fy) for fx in range(x_lo, x_hi + 1) for fy in range(y_lo, y_hi + 1))
+            if (info := get_food(pos)) is not None
+        ]
+
     def _detect_food_collisions(self, sprite_targets, food_items):
         """Detect food collisions for all sprites, considering bean size (radius)."""
         food_collisions = []
         if not food_items:
             return food_collisions
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for sprite, tx, ty in sprite_targets:
-            bean_x, bean_y = tx, ty
             bean_radius = sprite.bean.size / 2.0
-            for food_pos, food_info in food_items.items():
+            radius_sq = bean_radius * bean_radius
+            for food_pos, food_info in self._food_candidates(food_items, tx, ty, bean_radius):
                 food_x, food_y = food_pos
-                dist = math.hypot(bean_x - food_x, bean_y - food_y)
-                if dist <= bean_radius:
+                dx = tx - food_x
+                dy = ty - food_y
+                if dx * dx + dy * dy <= radius_sq:
                     food_type = food_info['type']
                     food_value = food_info['value']
-                    logger.debug(f">>>>> MovementSystem._detect_food_collisions: Bean {sprite.bean.id} collided with food at {food_pos} (type={food_type}, value={food_value}, dist={dist:.2f}, radius={bean_radius:.2f})")
+                    if debug_enabled:
+                        logger.debug(
+                            ">>>>> MovementSystem._detect_food_collisions: Bean %s collided with food at %s "
+                            "(type=%s, value=%s, dist=%.2f, radius=%.2f)",
+                            sprite.bean.id, food_pos, food_type, food_value, math.hypot(dx, dy), bean_radius,
+                        )
                     food_collisions.append({
                         'bean': sprite,
                         'food_type': food_type,
@@ -0,0 +1,36 @@
+"""Fixtures shared across test modules."""
+import pytest
+
+from beans.energy_system import EnergySystem, create_energy_system_from_name
+from config.loader import BeansConfig
+
+
+@pytest.fixture(scope="module")
+def standard_config() -> BeansConfig:
+    """Shared energy system config; tests must not mutate it."""
+    return BeansConfig(
+        speed_min=-5,
+        speed_max=5,
+        initial_energy=100.0,
+        initial_bean_size=10,
+        metabolism_base_burn=0.10,
+        energy_cost_per_speed=0.5,
+        energy_baseline=50.0,
+        fat_gain_rate=0.1,
+        energy_to_fat_ratio=1.0,
+        fat_burn_rate=0.1,
+        fat_to_energy_ratio=0.9,
+        min_bean_size=3.0,
+        max_bean_size=20.0,
+        size_sigma_frac=0.15,
+        size_penalty_above_k=0.20,
+        size_penalty_min_above=0.3,
+        size_penalty_below_k=0.15,
+        size_penalty_min_below=0.4,
+    )
+
+
+@pytest.fixture(scope="module")
+def energy_system(standard_config) -> EnergySystem:
+    """Energy systems hold no per-bean state, so one instance serves the module."""
+    return create_energy_system_from_name("standard", standard_config)
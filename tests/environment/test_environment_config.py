@@ -1,24 +1,26 @@
-import json
-
 import pytest
 
-from config.loader import load_config
+from config.loader import EnvironmentConfig, load_config_from_mapping
 
 
-def test_load_config_returns_environment_config(tmp_path):
+def test_load_config_returns_environment_config():
     data = {"world": {}, "beans": {}, "environment": {}}
-    p = tmp_path / "cfg.json"
-    p.write_text(json.dumps(data))
 
-    world_config, beans_config, env_config = load_config(str(p))
+    world_config, beans_config, env_config = load_config_from_mapping(data)
     # Assert basic environment defaults are present
     assert env_config.cell_size == 20
 
 
-def test_environment_config_validation_cell_size_must_be_positive(tmp_path):
+def test_environment_config_validation_cell_size_must_be_positive():
     data = {"world": {}, "beans": {}, "environment": {"cell_size": 0}}
-    p = tmp_path / "cfg.json"
-    p.write_text(json.dumps(data))
 
     with pytest.raises(ValueError):
-        load_config(str(p))
+        load_config_from_mapping(data)
+
+
+def test_environment_config_rejects_unknown_field():
+    env_config = EnvironmentConfig()
+    env_config.food_quality = 7
+    assert env_config.food_quality == 7
+    with pytest.raises(AttributeError):
+        env_config.food_qualty = 7
@@ -1,5 +1,5 @@
 from beans.world import World
-from src.config.loader import DEFAULT_BEANS_CONFIG, DEFAULT_ENVIRONMENT_CONFIG, DEFAULT_WORLD_CONFIG
+from config.loader import DEFAULT_BEANS_CONFIG, DEFAULT_ENVIRONMENT_CONFIG, DEFAULT_WORLD_CONFIG
 
 
 def test_world_calls_real_environment_step():
@@ -160,4 +160,18 @@ def test_food_spawning_stepwise_decay(distribution, steps):
         val = env.food_manager.get_food_at(pos).get(FoodType.COMMON, 0.0)
         # Decay is 0.9 per step
         expected = initial_val * (0.9 ** steps)
-        assert math.isclose(val, expected, rel_tol=1e-5), f"At {pos}: expected {expected}, got {val}"
\ No newline at end of file
+        assert math.isclose(val, expected, rel_tol=1e-5), f"At {pos}: expected {expected}, got {val}"
+
+
+def test_get_all_food_skips_depleted_cells():
+    food_manager = create_food_manager_from_name(make_env_config(), make_world_config())
+    food_manager.grid.clear()
+    food_manager.grid[(1, 1)] = {"value": 4.0, "type": FoodType.COMMON}
+    food_manager.grid[(2, 2)] = {"value": 0.0, "type": FoodType.COMMON}
+    food_manager.add_dead_bean_as_food((3, 3), 6.0)
+
+    all_food = food_manager.get_all_food()
+
+    assert set(all_food) == {(1, 1), (3, 3)}
+    assert all_food[(1, 1)]["value"] == 4.0
+    assert all_food[(3, 3)]["type"] == FoodType.DEAD_BEAN
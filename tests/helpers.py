@@ -0,0 +1,74 @@
+"""Plain test factories shared across test modules."""
+from functools import lru_cache
+
+import pytest
+
+from beans.bean import Bean, Sex
+from beans.genetics import Gene, Genotype, create_phenotype_from_values
+from beans.population import DensityPopulationEstimator
+from config.loader import BeansConfig
+
+
+@lru_cache(maxsize=128)
+def make_genotype(metabolism: float = 0.5, fat_accumulation: float = 0.5) -> Genotype:
+    """Return a shared genotype; Genotype is frozen, so beans can reuse one instance."""
+    return Genotype(
+        genes={
+            Gene.METABOLISM_SPEED: metabolism,
+            Gene.MAX_GENETIC_SPEED: 0.5,
+            Gene.FAT_ACCUMULATION: fat_accumulation,
+            Gene.MAX_GENETIC_AGE: 0.5,
+        }
+    )
+
+
+def make_bean_with_genes(
+    config: BeansConfig,
+    *,
+    energy: float | None = None,
+    size: float = 10.0,
+    speed: float = 3.0,
+    metabolism: float = 0.5,
+    fat_accumulation: float = 0.5,
+    bean_id: int = 1,
+) -> Bean:
+    """Deterministic bean factory using explicit genotype and phenotype values.
+
+    If `energy` is provided, it will be embedded into the phenotype at
+    construction time (avoids calling update_from_state from tests).
+    """
+    genotype = make_genotype(metabolism, fat_accumulation)
+    energy_val = float(energy) if energy is not None else float(config.initial_energy)
+    phenotype = create_phenotype_from_values(
+        config,
+        genotype,
+        age=0.0,
+        speed=float(speed),
+        energy=energy_val,
+        size=float(size),
+        target_size=float(size),
+    )
+    bean = Bean(config=config, id=bean_id, sex=Sex.MALE, genotype=genotype, phenotype=phenotype)
+    return bean
+
+
+ESTIMATOR = DensityPopulationEstimator()
+
+PLACEMENT_CASES = [
+    # small.json: ~6 beans (400*300*0.005 = 600 beans worth of space = ~6 at size 10)
+    pytest.param(400, 300, 0.005, 10, id="small_config"),
+    pytest.param(800, 600, 0.02, 8, id="medium_scale"),
+    pytest.param(2000, 1500, 0.01, 5, id="large_scale"),
+]
+
+
+def estimated_population(width, height, population_density, sprite_size):
+    """Return the total bean count the estimator would place for a case."""
+    male_count, female_count = ESTIMATOR.estimate(
+        width=width,
+        height=height,
+        sprite_size=sprite_size,
+        population_density=population_density,
+        male_female_ratio=1.0,
+    )
+    return male_count + female_count
@@ -1,5 +1,3 @@
-import logging
-
 import pytest
 from pydantic import ValidationError
 
@@ -8,10 +6,8 @@ from beans.genetics import Gene, Genotype, Phenotype, create_random_genotype
 from beans.placement import RandomPlacementStrategy
 from config.loader import BeansConfig
 
-logger = logging.getLogger(__name__)
-
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_genotype() -> Genotype:
     """Create a valid genotype for testing."""
     return Genotype(
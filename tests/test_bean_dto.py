@@ -1,19 +1,42 @@
-from beans.bean import Bean, BeanState
-from beans.genetics import create_phenotype, create_random_genotype
+import random
+
+import pytest
+
+from beans.bean import Bean, BeanState, Sex
+from beans.genetics import Genotype, create_phenotype, create_random_genotype
 from config.loader import BeansConfig
 
 
-def test_bean_to_state():
-    bcfg = BeansConfig(speed_min=-5, speed_max=5, initial_bean_size=10)
-    genotype = create_random_genotype()
-    phenotype = create_phenotype(bcfg, genotype)
-    bean = Bean(
-        config=bcfg,
-        id=42,
-        sex=__import__("beans").bean.Sex.MALE,
-        genotype=genotype,
-        phenotype=phenotype,
-    )
+@pytest.fixture(scope="module")
+def bcfg() -> BeansConfig:
+    """Shared bean config; tests must not mutate it."""
+    return BeansConfig(speed_min=-5, speed_max=5, initial_bean_size=10)
+
+
+@pytest.fixture(scope="module")
+def genotype() -> Genotype:
+    """Genotype is frozen, so every bean in this module can share it."""
+    return create_random_genotype(random.Random(0))
+
+
+@pytest.fixture
+def make_bean(bcfg, genotype):
+    """Return a factory building a fresh bean with its own phenotype."""
+
+    def _make(bean_id: int, sex: Sex = Sex.MALE) -> Bean:
+        return Bean(
+            config=bcfg,
+            id=bean_id,
+            sex=sex,
+            genotype=genotype,
+            phenotype=create_phenotype(bcfg, genotype),
+        )
+
+    return _make
+
+
+def test_bean_to_state(make_bean):
+    bean = make_bean(42)
 
     # Create a state from the bean twice
     state1 = bean.to_state()
@@ -27,17 +50,8 @@ def test_bean_to_state():
     assert state1.energy == bean.energy
 
 
-def test_bean_update_from_state():
-    bcfg = BeansConfig(speed_min=-5, speed_max=5, initial_bean_size=10)
-    genotype = create_random_genotype()
-    phenotype = create_phenotype(bcfg, genotype)
-    bean = Bean(
-        config=bcfg,
-        id=99,
-        sex=__import__("beans").bean.Sex.FEMALE,
-        genotype=genotype,
-        phenotype=phenotype,
-    )
+def test_bean_update_from_state(make_bean):
+    bean = make_bean(99, Sex.FEMALE)
 
     state = bean.to_state()
     state.store(age=5.0, speed=1.0, energy=12.0, size=8.0)
@@ -46,3 +60,15 @@ def test_bean_update_from_state():
     assert bean.speed == 1.0
     assert bean.energy == 12.0
     assert bean.size == 8.0
+
+
+def test_bean_update_from_own_state_returns_same_dto(make_bean):
+    bean = make_bean(7)
+
+    state = bean.to_state()
+    state.store(age=3.0, energy=20.0)
+    returned = bean.update_from_state(state)
+    assert returned is state
+    assert bean.age == 3.0
+    assert bean.energy == 20.0
+    assert bean.to_state() == returned
@@ -1,5 +1,7 @@
 import pytest
 
+from beans.bean import BeanState
+from beans.dynamics.bean_dynamics import BeanDynamics
 from beans.genetics import (
     Gene,
     Genotype,
@@ -10,8 +12,6 @@ from beans.genetics import (
 )
 from beans.world import World
 from config.loader import BeansConfig, EnvironmentConfig, WorldConfig
-from src.beans.bean import BeanState
-from src.beans.dynamics.bean_dynamics import BeanDynamics
 
 
 def test_bean_dynamics_speed_calculation():
@@ -32,7 +32,7 @@ def test_bean_dynamics_speed_calculation():
     # For age=5, max_age=100, min_speed_factor=0.2, vmax=1.0, size_penalty=1.0
     expected_age_factor = age_speed_factor(5, dummy_max_age, config.min_speed_factor)
     expected_speed = max(config.min_speed_factor, config.speed_max * expected_age_factor * 1.0)
-    assert speed == expected_speed
+    assert speed == pytest.approx(expected_speed)
 
 
 def test_world_step_calculates_bean_speed_correctly():
@@ -147,3 +147,15 @@ def test_bean_dynamics_size_speed_penalty_behaviour():
     state.store(size=1.0)
     speed_small = bd.calculate_speed(state, genotype, dummy_max_age)
     assert speed_small < speed_target
+
+
+@pytest.mark.parametrize("size", [7.0, 9.0, 10.0, 11.0, 13.0])
+def test_bean_dynamics_no_size_penalty_within_two_sigma(size):
+    """Sizes within two sigma of the target move at the unpenalised speed."""
+    cfg = BeansConfig(speed_min=0.0, speed_max=1.0, min_speed_factor=0.0, initial_bean_size=10)
+    bd = BeanDynamics(cfg)
+    genotype = Genotype(values=(1.0, 1.0, 1.0, 1.0))
+
+    at_target = BeanState(id=1, age=5, speed=0.0, energy=10.0, size=10.0, target_size=10.0, alive=True)
+    deviated = BeanState(id=1, age=5, speed=0.0, energy=10.0, size=size, target_size=10.0, alive=True)
+    assert bd.calculate_speed(deviated, genotype, 100) == bd.calculate_speed(at_target, genotype, 100)
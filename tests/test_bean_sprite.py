@@ -1,4 +1,4 @@
-import logging
+import math
 
 import arcade
 import pytest
@@ -8,8 +8,6 @@ from beans.genetics import Gene, Genotype, Phenotype
 from config.loader import BeansConfig
 from rendering.bean_sprite import BeanSprite
 
-logger = logging.getLogger(__name__)
-
 
 class TestBeanSprite:
     @pytest.fixture
@@ -146,3 +144,11 @@ class TestBeanSprite:
         color = arcade.color.BLUE
         sprite = BeanSprite(male_bean, position, color, direction=450.0)
         assert sprite.direction == 90.0
+
+    @pytest.mark.parametrize("direction", [0.0, 37.5, 90.0, 271.25])
+    def test_heading_vector_tracks_direction_changes(self, male_bean, direction):
+        sprite = BeanSprite(male_bean, (100.0, 200.0), arcade.color.BLUE, direction=10.0)
+        assert sprite.heading_vector() == (math.cos(math.radians(10.0)), math.sin(math.radians(10.0)))
+
+        sprite.direction = direction
+        assert sprite.heading_vector() == (math.cos(math.radians(direction)), math.sin(math.radians(direction)))
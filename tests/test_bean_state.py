@@ -35,3 +35,10 @@ def test_beanstate_partial_store_updates_only_informed_fields():
     assert state.speed == 2.0  # unchanged
     assert state.energy == 9.5
     assert state.size == 4.0  # unchanged
+
+
+def test_beanstate_store_is_visible_to_equality_and_dump():
+    state = BeanState(id=3, age=1.0, speed=2.0, energy=3.0, size=4.0, target_size=4.0, alive=True)
+    state.store(energy=7.0, target_size=6.0)
+    assert state == BeanState(id=3, age=1.0, speed=2.0, energy=7.0, size=4.0, target_size=6.0, alive=True)
+    assert state.model_dump()["energy"] == 7.0
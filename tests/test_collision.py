@@ -3,11 +3,12 @@ from typing import Dict, List, Tuple
 
 import pytest
 
-from src.beans.bean import Bean, Sex
-from src.beans.genetics import create_phenotype, create_random_genotype
-from src.config.loader import DEFAULT_BEANS_CONFIG
-from src.rendering.bean_sprite import BeanSprite
-from src.rendering.movement import SpriteMovementSystem
+from beans.bean import Bean, Sex
+from beans.genetics import create_phenotype
+from config.loader import DEFAULT_BEANS_CONFIG
+from rendering.bean_sprite import BeanSprite
+from rendering.movement import SpriteMovementSystem
+from tests.helpers import make_genotype
 
 # Helper functions
 
@@ -23,7 +24,7 @@ def make_bean_and_sprite(
         # Use default beans config for tests when no config provided
         beans_config = DEFAULT_BEANS_CONFIG
 
-    genotype = create_random_genotype()
+    genotype = make_genotype()
     phenotype = create_phenotype(beans_config, genotype)
     bean = Bean(beans_config, id, sex, genotype=genotype, phenotype=phenotype)
     # Set deterministic properties
@@ -1,17 +1,11 @@
 import json
-import logging
-import os
-import tempfile
 
 import pytest
 
-from config.loader import DEFAULT_BEANS_CONFIG, load_config
+from config.loader import DEFAULT_BEANS_CONFIG, BeansConfig, load_config, load_config_from_mapping
 
-logger = logging.getLogger(__name__)
 
-
-def test_load_config_with_valid_file():
-    # Create a temporary config file
+def test_load_config_with_valid_file(tmp_path):
     config_data = {
         "world": {
             "male_sprite_color": "blue",
@@ -28,167 +22,55 @@ def test_load_config_with_valid_file():
             "female_bean_color": "magenta",
         },
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-
-    try:
-        world_config, beans_config, env_config = load_config(temp_file)
-        assert world_config.male_sprite_color == "blue"
-        assert world_config.female_sprite_color == "pink"
-        assert world_config.male_female_ratio == 1.0
-        assert world_config.population_density == 0.5
-        assert world_config.placement_strategy == "random"
-        assert world_config.width == 800
-        assert world_config.height == 600
-        assert beans_config.speed_min == -5
-        assert beans_config.speed_max == 5
-        assert beans_config.initial_bean_size == 10
-        assert beans_config.male_bean_color == "navy"
-        assert beans_config.female_bean_color == "magenta"
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_invalid_values_raise():
-    # Negative width should raise
-    config_data = {
-        "world": {
-            "width": -10,
-            "height": 100,
-            "sprite_bean_size": 5,
-            "male_female_ratio": 1.0,
-            "population_density": 0.1,
-            "placement_strategy": "random",
-        },
-        "beans": {},
-    }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-# Duplicate test for zero speed values removed; comprehensive checks exist later.
-
-
-def test_load_config_world_invalid_height_raises():
-    # height <=0 should raise
-    config_data = {"world": {"height": 0}, "beans": {}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_beans_invalid_initial_bean_size_raises():
-    # initial_bean_size <=0 should raise
-    config_data = {"world": {}, "beans": {"initial_bean_size": -1}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_world_invalid_population_density_raises():
-    # population_density <=0 should raise
-    config_data = {"world": {"population_density": 0}, "beans": {}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_world_invalid_male_female_ratio_raises():
-    # male_female_ratio <=0 should raise
-    config_data = {"world": {"male_female_ratio": -1}, "beans": {}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_beans_invalid_initial_energy_raises():
-    # initial_energy <0 should raise
-    config_data = {"world": {}, "beans": {"initial_energy": -10}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_beans_invalid_energy_gain_raises():
-    # energy_gain_per_step <0 should raise
-    config_data = {"world": {}, "beans": {"energy_gain_per_step": -1}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_beans_invalid_energy_cost_raises():
-    # energy_cost_per_speed <0 should raise
-    config_data = {"world": {}, "beans": {"energy_cost_per_speed": -0.1}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-
-def test_load_config_beans_invalid_speed_zero_raises():
-    # speed_min equal to zero should raise
-    config_data = {"world": {}, "beans": {"speed_min": 0, "speed_max": 5}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
-
-    # speed_max equal to zero should raise
-    config_data = {"world": {}, "beans": {"speed_min": -5, "speed_max": 0}}
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(config_data, f)
-        temp_file = f.name
-    try:
-        with pytest.raises(ValueError):
-            load_config(temp_file)
-    finally:
-        os.unlink(temp_file)
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config_data))
+
+    world_config, beans_config, env_config = load_config(str(config_file))
+    assert world_config.male_sprite_color == "blue"
+    assert world_config.female_sprite_color == "pink"
+    assert world_config.male_female_ratio == 1.0
+    assert world_config.population_density == 0.5
+    assert world_config.placement_strategy == "random"
+    assert world_config.width == 800
+    assert world_config.height == 600
+    assert beans_config.speed_min == -5
+    assert beans_config.speed_max == 5
+    assert beans_config.initial_bean_size == 10
+    assert beans_config.male_bean_color == "navy"
+    assert beans_config.female_bean_color == "magenta"
+
+
+@pytest.mark.parametrize(
+    "config_data",
+    [
+        pytest.param(
+            {
+                "world": {
+                    "width": -10,
+                    "height": 100,
+                    "sprite_bean_size": 5,
+                    "male_female_ratio": 1.0,
+                    "population_density": 0.1,
+                    "placement_strategy": "random",
+                },
+                "beans": {},
+            },
+            id="world_negative_width",
+        ),
+        pytest.param({"world": {"height": 0}, "beans": {}}, id="world_zero_height"),
+        pytest.param({"world": {"population_density": 0}, "beans": {}}, id="world_zero_population_density"),
+        pytest.param({"world": {"male_female_ratio": -1}, "beans": {}}, id="world_negative_male_female_ratio"),
+        pytest.param({"world": {}, "beans": {"initial_bean_size": -1}}, id="beans_negative_initial_bean_size"),
+        pytest.param({"world": {}, "beans": {"initial_energy": -10}}, id="beans_negative_initial_energy"),
+        pytest.param({"world": {}, "beans": {"energy_gain_per_step": -1}}, id="beans_negative_energy_gain"),
+        pytest.param({"world": {}, "beans": {"energy_cost_per_speed": -0.1}}, id="beans_negative_energy_cost"),
+        pytest.param({"world": {}, "beans": {"speed_min": 0, "speed_max": 5}}, id="beans_zero_speed_min"),
+        pytest.param({"world": {}, "beans": {"speed_min": -5, "speed_max": 0}}, id="beans_zero_speed_max"),
+    ],
+)
+def test_load_config_invalid_values_raise(config_data):
+    with pytest.raises(ValueError):
+        load_config_from_mapping(config_data)
 
 
 class TestEnergySystemConfigFields:
@@ -237,3 +119,17 @@ class TestEnergySystemConfigFields:
     def test_beans_config_has_size_penalty_min_below(self):
         """BeansConfig should have size_penalty_min_below with default 0.4."""
         assert DEFAULT_BEANS_CONFIG.size_penalty_min_below == 0.4
+
+
+def test_beans_config_live_update_and_unknown_field():
+    cfg = BeansConfig(speed_min=-5, speed_max=5)
+    cfg.metabolism_base_burn = 0.0
+    assert cfg.metabolism_base_burn == 0.0
+    with pytest.raises(AttributeError):
+        cfg.metabolism_burn = 0.5
+
+
+@pytest.mark.parametrize("path", ["", "does/not/exist.json"])
+def test_load_config_missing_file_raises(path):
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        load_config(path)
@@ -1,12 +1,13 @@
+import math
 import random
-import logging
+from dataclasses import replace
+
 import pytest
 from beans.bean import Bean, Sex
 from beans.genetics import Gene, Genotype, Phenotype, age_energy_efficiency
 from beans.survival import DefaultSurvivalChecker
 from beans.world import World
 from config.loader import BeansConfig, EnvironmentConfig, WorldConfig
-logger = logging.getLogger(__name__)
 
 
 @pytest.fixture
@@ -31,8 +32,14 @@ def make_beans_config(**overrides) -> BeansConfig:
     return BeansConfig(speed_min=-5, speed_max=5, max_age_rounds=100, **overrides)
 
 
-def test_bean_initial_energy_from_config(sample_genotype):
-    cfg = make_beans_config(initial_energy=50.0)
+@pytest.fixture(scope="module")
+def beans_config() -> BeansConfig:
+    """Shared baseline config; derive variants with dataclasses.replace instead of mutating."""
+    return make_beans_config()
+
+
+def test_bean_initial_energy_from_config(sample_genotype, beans_config):
+    cfg = replace(beans_config, initial_energy=50.0)
     phenotype = Phenotype(age=0.0, speed=5.0, energy=50.0, size=5.0, target_size=5.0)
     bean = Bean(config=cfg, id=1, sex=Sex.MALE, genotype=sample_genotype, phenotype=phenotype)
     assert bean.energy == 50.0
@@ -41,136 +48,150 @@ def test_bean_initial_energy_from_config(sample_genotype):
 class TestBeanSurvival:
     """Tests for Bean survival methods."""
 
-    def test_can_survive_age_true_when_below_max(self, sample_genotype):
+    def test_can_survive_age_true_when_below_max(self, sample_genotype, beans_config):
         """Bean can survive when age is below genetic max age, unless probabilistically killed by obesity."""
-        cfg = make_beans_config()
         phenotype = Phenotype(age=10.0, speed=5.0, energy=100.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         # Allow for probabilistic obesity death
         assert result.alive is True or result.reason == "obesity"
 
-    def test_can_survive_age_false_when_at_max(self, sample_genotype):
+    def test_can_survive_age_false_when_at_max(self, sample_genotype, beans_config):
         """Bean cannot survive when age equals genetic max age."""
-        cfg = make_beans_config()
         # Gene value 0.5 means max age = 100 * 0.5 = 50 rounds
         phenotype = Phenotype(age=50.0, speed=5.0, energy=100.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         assert result.alive is False
         assert result.reason == "max_age_reached"
 
-    def test_can_survive_age_false_when_above_max(self, sample_genotype):
+    def test_can_survive_age_false_when_above_max(self, sample_genotype, beans_config):
         """Bean cannot survive when age exceeds genetic max age."""
-        cfg = make_beans_config()
         phenotype = Phenotype(age=60.0, speed=5.0, energy=100.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         assert result.alive is False
         assert result.reason == "max_age_reached"
 
-    def test_survive_returns_true_when_healthy(self, sample_genotype):
+    def test_survive_returns_true_when_healthy(self, sample_genotype, beans_config):
         """survive() returns True when bean has energy and is young enough."""
-        cfg = make_beans_config()
         phenotype = Phenotype(age=10.0, speed=5.0, energy=50.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         # Survival may fail due to probabilistic obesity death, so check for both possible outcomes
         if result.alive:
             assert result.reason is None
         else:
             assert result.reason == "obesity"
 
-    def test_survive_returns_false_with_reason_when_too_old(self, sample_genotype):
+    def test_survive_returns_false_with_reason_when_too_old(self, sample_genotype, beans_config):
         """survive() returns False with reason when bean exceeds max age."""
-        cfg = make_beans_config()
         phenotype = Phenotype(age=60.0, speed=5.0, energy=50.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         assert result.alive is False
         assert result.reason == "max_age_reached"
 
-    def test_survive_returns_false_with_reason_when_no_energy(self, sample_genotype):
+    def test_survive_returns_false_with_reason_when_no_energy(self, sample_genotype, beans_config):
         """When energy is depleted but bean still has fat, survival checker draws on fat and bean survives."""
-        cfg = make_beans_config()
         phenotype = Phenotype(age=10.0, speed=5.0, energy=0.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         assert result.alive is True
         assert result.message is not None
         assert "Drew" in result.message
 
-    def test_survive_age_takes_priority_over_energy(self, sample_genotype):
+    def test_survive_age_takes_priority_over_energy(self, sample_genotype, beans_config):
         """When both conditions fail, age death reason takes priority."""
-        cfg = make_beans_config()
         phenotype = Phenotype(age=60.0, speed=5.0, energy=0.0, size=5.0, target_size=5.0)
         bean = Bean(
-            config=cfg,
+            config=beans_config,
             id=1,
             sex=Sex.MALE,
             genotype=sample_genotype,
             phenotype=phenotype,
         )
-        result = DefaultSurvivalChecker(cfg, rng=random.Random()).check(bean)
+        result = DefaultSurvivalChecker(beans_config, rng=random.Random()).check(bean)
         assert result.alive is False
         assert result.reason == "max_age_reached"
 
+    def test_obesity_deaths_follow_obesity_probability(self, sample_genotype, beans_config):
+        """Seeded obesity deaths match independent draws against obesity_death_probability."""
+        cfg = replace(beans_config, obesity_death_probability=0.5, obesity_threshold_factor=1.0)
+        phenotype = Phenotype(age=10.0, speed=5.0, energy=100.0, size=cfg.max_bean_size, target_size=5.0)
+        bean = Bean(config=cfg, id=1, sex=Sex.MALE, genotype=sample_genotype, phenotype=phenotype)
+        checker = DefaultSurvivalChecker(cfg, rng=random.Random(42))
+
+        prob = checker.obesity_death_probability(bean)
+        deaths = sum(checker.check(bean).reason == "obesity" for _ in range(100))
+
+        reference_rng = random.Random(42)
+        assert prob == pytest.approx(0.5)
+        assert deaths == sum(reference_rng.random() < prob for _ in range(100))
+
+    def test_obesity_probability_is_none_below_threshold(self, sample_genotype, beans_config):
+        """Beans below the obesity threshold get no probability (and no random draw)."""
+        phenotype = Phenotype(age=10.0, speed=5.0, energy=100.0, size=beans_config.min_bean_size, target_size=5.0)
+        bean = Bean(config=beans_config, id=1, sex=Sex.MALE, genotype=sample_genotype, phenotype=phenotype)
+
+        assert DefaultSurvivalChecker(beans_config, rng=random.Random()).obesity_death_probability(bean) is None
+
 
 class TestAgeEnergyEfficiency:
     """Tests for age_energy_efficiency function in genetics."""
 
-    def test_newborn_has_minimum_efficiency(self, sample_genotype):
+    def test_newborn_has_minimum_efficiency(self, sample_genotype, beans_config):
         """At age=0, efficiency equals min_energy_efficiency from config."""
-        cfg = make_beans_config(min_energy_efficiency=0.3)
+        cfg = replace(beans_config, min_energy_efficiency=0.3)
         efficiency = age_energy_efficiency(age=0.0, max_age=100.0, min_efficiency=cfg.min_energy_efficiency)
         assert efficiency == pytest.approx(0.3)
 
-    def test_midlife_has_peak_efficiency(self, sample_genotype):
+    def test_midlife_has_peak_efficiency(self, sample_genotype, beans_config):
         """At mid-life, efficiency is near or at 1.0 (peak)."""
-        cfg = make_beans_config(min_energy_efficiency=0.3)
+        cfg = replace(beans_config, min_energy_efficiency=0.3)
         # Mid-life at about 25% of max age (similar to age_speed_factor peak)
         efficiency = age_energy_efficiency(age=25.0, max_age=100.0, min_efficiency=cfg.min_energy_efficiency)
         assert efficiency > 0.5  # Should be higher than minimum
 
-    def test_old_age_has_reduced_efficiency(self, sample_genotype):
+    def test_old_age_has_reduced_efficiency(self, sample_genotype, beans_config):
         """At old age, efficiency declines but stays above minimum."""
-        cfg = make_beans_config(min_energy_efficiency=0.3)
+        cfg = replace(beans_config, min_energy_efficiency=0.3)
         efficiency = age_energy_efficiency(age=95.0, max_age=100.0, min_efficiency=cfg.min_energy_efficiency)
         assert efficiency >= 0.3  # Never below floor
         assert efficiency < 1.0  # But reduced from peak
@@ -182,8 +203,21 @@ class TestAgeEnergyEfficiency:
             efficiency = age_energy_efficiency(age=float(age), max_age=100.0, min_efficiency=min_eff)
             assert efficiency >= min_eff
 
+    @pytest.mark.parametrize("age", [0.0, 10.0, 25.0, 50.0, 90.0, 100.0, 150.0])
+    def test_efficiency_follows_lifecycle_curve(self, age):
+        """Efficiency matches the normalized x^2 * e^(-2x) * (1 - x^4) lifecycle curve."""
+        min_eff = 0.3
+        x = min(age / 100.0, 1.0)
+        raw = (x**2) * math.exp(-2.0 * x) * (1 - x**4)
+        expected = min_eff + (1.0 - min_eff) * min(raw / 0.09, 1.0)
+        assert age_energy_efficiency(age=age, max_age=100.0, min_efficiency=min_eff) == pytest.approx(expected)
+
+    def test_non_positive_max_age_returns_minimum(self):
+        """A bean without a lifespan stays at the efficiency floor."""
+        assert age_energy_efficiency(age=10.0, max_age=0.0, min_efficiency=0.3) == 0.3
+
 
-def test_world_records_dead_bean_with_reason():
+def test_world_records_dead_bean_with_reason(beans_config):
     world_cfg = WorldConfig(
         male_sprite_color="blue",
         female_sprite_color="red",
@@ -193,8 +227,10 @@ def test_world_records_dead_bean_with_reason():
         population_density=0.01,  # at least one bean
         placement_strategy="random",
         population_estimator="density",
+        seed=42,
     )
-    beans_cfg = make_beans_config(
+    beans_cfg = replace(
+        beans_config,
         initial_energy=1.0,
         energy_gain_per_step=0.0,
         energy_cost_per_speed=10.0,  # high cost to ensure death
@@ -1,76 +1,27 @@
 import random
+
+import pytest
 from beans.bean import Bean, Sex
-from beans.energy_system import create_energy_system_from_name
 from beans.genetics import (
     Gene,
     Genotype,
     create_phenotype_from_values,
     create_random_genotype,
+    size_target,
 )
 from beans.survival import DefaultSurvivalChecker
 from config.loader import BeansConfig
+from tests.helpers import make_bean_with_genes
 
 
-def make_test_config():
-    return BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        initial_energy=100.0,
-        initial_bean_size=10,
-        metabolism_base_burn=0.10,
-        energy_cost_per_speed=0.5,
-        energy_baseline=50.0,
-        fat_gain_rate=0.1,
-        energy_to_fat_ratio=1.0,
-        fat_burn_rate=0.1,
-        fat_to_energy_ratio=0.9,
-        min_bean_size=3.0,
-        max_bean_size=20.0,
-        size_sigma_frac=0.15,
-        size_penalty_above_k=0.20,
-        size_penalty_min_above=0.3,
-        size_penalty_below_k=0.15,
-        size_penalty_min_below=0.4,
-    )
-
-
-def make_bean_with_genes(
-    config: BeansConfig,
-    *,
-    energy: float | None = None,
-    size: float = 10.0,
-    speed: float = 3.0,
-):
-    """Deterministic bean factory using explicit genotype and phenotype values.
-
-    If `energy` is provided, it will be embedded into the phenotype at
-    construction time (avoids calling update_from_state from tests).
-    """
-    genes = {
-        Gene.METABOLISM_SPEED: 0.5,
-        Gene.MAX_GENETIC_SPEED: 0.5,
-        Gene.FAT_ACCUMULATION: 0.5,
-        Gene.MAX_GENETIC_AGE: 0.5,
-    }
-    genotype = Genotype(genes=genes)
-    energy_val = float(energy) if energy is not None else float(config.initial_energy)
-    phenotype = create_phenotype_from_values(
-        config,
-        genotype,
-        age=0.0,
-        speed=float(speed),
-        energy=energy_val,
-        size=float(size),
-        target_size=float(size),
-    )
-    bean = Bean(config=config, id=1, sex=Sex.MALE, genotype=genotype, phenotype=phenotype)
-    return bean
+@pytest.fixture(scope="module")
+def base_genotype() -> Genotype:
+    """Deterministic random genotype for tests that need any valid genotype."""
+    return create_random_genotype(random.Random(0))
 
 
-def test_intake_increases_energy():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    bean = make_bean_with_genes(config, energy=50.0)
+def test_intake_increases_energy(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=50.0)
 
     before = bean.energy
     # Intake is now handled elsewhere; just check that energy system does not mutate energy without intake
@@ -79,11 +30,9 @@ def test_intake_increases_energy():
     assert bean.energy == before
 
 
-def test_metabolism_reduces_energy_over_time():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
+def test_metabolism_reduces_energy_over_time(energy_system, standard_config):
     # start with higher energy and no intake
-    bean = make_bean_with_genes(config, energy=120.0)
+    bean = make_bean_with_genes(standard_config, energy=120.0)
 
     prev = bean.energy
     for _ in range(5):
@@ -94,10 +43,47 @@ def test_metabolism_reduces_energy_over_time():
     assert bean.energy == 120.0
 
 
-def test_size_increases_when_energy_above_baseline():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    bean = make_bean_with_genes(config, energy=config.energy_baseline + 20)
+def test_metabolism_trajectory_matches_recurrence(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=120.0)
+    fat_accumulation = bean.genotype[Gene.FAT_ACCUMULATION]
+    metabolism_factor = 1 + 0.5 * bean.genotype[Gene.METABOLISM_SPEED]
+
+    energies = []
+    for _ in range(5):
+        (state,) = energy_system.apply_energy_system_batch([bean])
+        bean.update_from_state(state)
+        energies.append(bean.energy)
+
+    # Reference recurrence: basal burn, movement cost, then fat storage while above baseline
+    energy, size = 120.0, 10.0
+    expected = []
+    for _ in range(5):
+        energy -= standard_config.metabolism_base_burn * metabolism_factor * size
+        energy -= abs(bean.speed) * standard_config.energy_cost_per_speed
+        surplus = energy - standard_config.energy_baseline
+        if surplus > 0:
+            fat_gain = standard_config.fat_gain_rate * fat_accumulation * surplus
+            size = min(size + fat_gain, standard_config.max_bean_size)
+            energy -= fat_gain * standard_config.energy_to_fat_ratio
+        expected.append(energy)
+
+    assert all(later <= earlier for earlier, later in zip(energies, energies[1:]))
+    assert energies == pytest.approx(expected)
+
+
+def test_higher_metabolism_gene_increases_burn_rate(energy_system, standard_config):
+    slow, fast = (
+        make_bean_with_genes(standard_config, energy=120.0, metabolism=0.0, bean_id=1),
+        make_bean_with_genes(standard_config, energy=120.0, metabolism=1.0, bean_id=2),
+    )
+
+    slow_state, fast_state = energy_system.apply_energy_system_batch([slow, fast])
+
+    assert fast_state.energy < slow_state.energy < 120.0
+
+
+def test_size_increases_when_energy_above_baseline(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=standard_config.energy_baseline + 20)
 
     size_before = bean.size
     state = energy_system.apply_energy_system(bean)
@@ -105,10 +91,8 @@ def test_size_increases_when_energy_above_baseline():
     assert bean.size == size_before
 
 
-def test_size_decreases_when_energy_below_baseline():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    bean = make_bean_with_genes(config, energy=config.energy_baseline - 20)
+def test_size_decreases_when_energy_below_baseline(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=standard_config.energy_baseline - 20)
 
     size_before = bean.size
     state = energy_system.apply_energy_system(bean)
@@ -116,24 +100,44 @@ def test_size_decreases_when_energy_below_baseline():
     assert bean.size == size_before
 
 
-def test_size_clamping():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    # too small (create bean already at small size)
-    bean = make_bean_with_genes(config, energy=50.0, size=1.0)
+def test_size_clamping(energy_system, standard_config):
+    too_small = make_bean_with_genes(standard_config, energy=50.0, size=1.0, bean_id=1)
+    too_large = make_bean_with_genes(standard_config, energy=50.0, size=50.0, bean_id=2)
+
+    small_state, large_state = energy_system.apply_energy_system_batch([too_small, too_large])
+    # the returned states are clamped; the original beans still hold the old sizes
+    assert small_state.size >= standard_config.min_bean_size
+    assert large_state.size <= standard_config.max_bean_size
+    assert (too_small.size, too_large.size) == (1.0, 50.0)
+
+
+def test_target_size_matches_genetic_size_target(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=50.0, fat_accumulation=0.8)
+
     state = energy_system.apply_energy_system(bean)
-    # the returned state should be clamped; original bean still holds the old size
-    assert state.size >= config.min_bean_size
-    assert bean.size == 1.0
+    assert state.target_size == pytest.approx(size_target(bean.age, bean.genotype, standard_config))
+
+
+@pytest.mark.parametrize(
+    ("gene", "energy", "field", "increases"),
+    [
+        ("metabolism", 50.0, "energy", False),  # faster metabolism burns more energy
+        ("fat_accumulation", 120.0, "size", True),  # surplus is stored as more fat
+        ("fat_accumulation", 20.0, "size", False),  # deficit burns more fat
+    ],
+)
+def test_higher_gene_value_shifts_outcome(energy_system, standard_config, gene, energy, field, increases):
+    beans = [
+        make_bean_with_genes(standard_config, energy=energy, bean_id=1, **{gene: 0.1}),
+        make_bean_with_genes(standard_config, energy=energy, bean_id=2, **{gene: 0.9}),
+    ]
+
+    low, high = (getattr(state, field) for state in energy_system.apply_energy_system_batch(beans))
 
-    # too large
-    bean2 = make_bean_with_genes(config, energy=50.0, size=50.0)
-    state2 = energy_system.apply_energy_system(bean2)
-    assert state2.size <= config.max_bean_size
-    assert bean2.size == 50.0
+    assert (high > low) if increases else (high < low)
 
 
-def test_survival_health_and_starvation():
+def test_survival_health_and_starvation(base_genotype):
     config = BeansConfig(
         speed_min=-5,
         speed_max=5,
@@ -142,19 +146,15 @@ def test_survival_health_and_starvation():
         min_bean_size=3.0,
         max_bean_size=20.0,
     )
-    # energy_system is not required for this survival test; remove unused variable
-    genotype = create_random_genotype()
-    phenotype = create_phenotype_from_values(config, genotype, age=0.0, speed=0.0, energy=100.0, size=10.0, target_size=10.0)
-    phenotype.size = 30.0  # Obese
     # Create bean already at zero energy to test immediate starvation behavior
     bean = Bean(
         config=config,
         id=1,
         sex=Sex.MALE,
-        genotype=genotype,
+        genotype=base_genotype,
         phenotype=create_phenotype_from_values(
             config,
-            genotype,
+            base_genotype,
             age=0.0,
             speed=0.0,
             energy=0.0,
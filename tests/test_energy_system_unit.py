@@ -1,83 +1,11 @@
-from beans.bean import Bean, Sex
-from beans.energy_system import create_energy_system_from_name
-from beans.genetics import Gene, Genotype, create_phenotype_from_values
-from config.loader import BeansConfig
-
-# Minimal helpers copied from existing tests for deterministic creation
-
-
-def make_test_config():
-    return BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        initial_energy=100.0,
-        initial_bean_size=10,
-        metabolism_base_burn=0.10,
-        energy_cost_per_speed=0.5,
-        energy_baseline=50.0,
-        fat_gain_rate=0.1,
-        energy_to_fat_ratio=1.0,
-        fat_burn_rate=0.1,
-        fat_to_energy_ratio=0.9,
-        min_bean_size=3.0,
-        max_bean_size=20.0,
-        size_sigma_frac=0.15,
-        size_penalty_above_k=0.20,
-        size_penalty_min_above=0.3,
-        size_penalty_below_k=0.15,
-        size_penalty_min_below=0.4,
-    )
-
-
-def make_bean_with_genes(
-    config: BeansConfig,
-    *,
-    energy: float | None = None,
-    size: float = 10.0,
-    speed: float = 3.0,
-):
-    """Create a bean deterministically using explicit genotype and phenotype values.
-
-    Uses `create_phenotype_from_values` to avoid RNG-based variations and ensure
-    tests are deterministic.
-    """
-    genes = {
-        Gene.METABOLISM_SPEED: 0.5,
-        Gene.MAX_GENETIC_SPEED: 0.5,
-        Gene.FAT_ACCUMULATION: 0.5,
-        Gene.MAX_GENETIC_AGE: 0.5,
-    }
-    genotype = Genotype(genes=genes)
-    # Determine deterministic energy value
-    energy_val = energy if energy is not None else config.initial_energy
-    phenotype = create_phenotype_from_values(
-        config,
-        genotype,
-        age=0.0,
-        speed=float(speed),
-        energy=float(energy_val),
-        size=float(size),
-        target_size=float(size),
-    )
-    bean = Bean(config=config, id=1, sex=Sex.MALE, genotype=genotype, phenotype=phenotype)
-    return bean
-
-
-def test_apply_energy_returns_state_and_does_not_mutate_bean():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    bean = make_bean_with_genes(config, energy=50.0)
+from dataclasses import replace
 
-    before = bean.energy
-    state = energy_system.apply_energy_system(bean)
-    assert state.energy < before  # energy should decrease due to metabolism
-    assert bean.energy == before
+from beans.energy_system import create_energy_system_from_name
+from tests.helpers import make_bean_with_genes
 
 
-def test_intake_changes_returned_state_but_not_bean():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    bean = make_bean_with_genes(config, energy=50.0)
+def test_apply_energy_returns_state_and_does_not_mutate_bean(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=50.0)
 
     before = bean.energy
     state = energy_system.apply_energy_system(bean)
@@ -85,10 +13,8 @@ def test_intake_changes_returned_state_but_not_bean():
     assert bean.energy == before
 
 
-def test_metabolism_reduces_returned_energy_over_time():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-    bean = make_bean_with_genes(config, energy=120.0)
+def test_metabolism_reduces_returned_energy_over_time(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=120.0)
 
     prev = bean.energy
     for _ in range(5):
@@ -98,17 +24,41 @@ def test_metabolism_reduces_returned_energy_over_time():
     assert bean.energy == 120.0
 
 
-def test_size_clamping_on_returned_state():
-    config = make_test_config()
-    energy_system = create_energy_system_from_name("standard", config)
-
-    bean = make_bean_with_genes(config, energy=50.0)
+def test_size_clamping_on_returned_state(energy_system, standard_config):
+    bean = make_bean_with_genes(standard_config, energy=50.0)
     # set bean to be too small via state
     state0 = bean.to_state()
     state0.store(size=1.0)
     bean.update_from_state(state0)
 
     state = energy_system.apply_energy_system(bean)
-    assert state.size >= config.min_bean_size
+    assert state.size >= standard_config.min_bean_size
     # original bean remains at size 1.0 until update_from_state is called
     assert bean.size == 1.0
+
+
+def test_batch_matches_per_bean_application_and_keeps_order(energy_system, standard_config):
+    beans = [
+        make_bean_with_genes(standard_config, energy=120.0, bean_id=1),
+        make_bean_with_genes(standard_config, energy=20.0, size=15.0, metabolism=1.0, bean_id=2),
+        make_bean_with_genes(standard_config, energy=-5.0, size=4.0, fat_accumulation=0.9, bean_id=3),
+    ]
+
+    batch = [(s.energy, s.size, s.target_size) for s in energy_system.apply_energy_system_batch(beans)]
+    single = []
+    for bean in beans:
+        state = energy_system.apply_energy_system(bean)
+        single.append((state.energy, state.size, state.target_size))
+
+    assert batch == single
+    assert [bean.energy for bean in beans] == [120.0, 20.0, -5.0]
+
+
+def test_factory_reuses_energy_system_per_config(standard_config):
+    other_config = replace(standard_config)
+
+    energy_system = create_energy_system_from_name("standard", standard_config)
+
+    assert create_energy_system_from_name("Standard", standard_config) is energy_system
+    assert create_energy_system_from_name("", standard_config) is energy_system
+    assert create_energy_system_from_name("standard", other_config) is not energy_system
@@ -1,7 +1,8 @@
-from src.beans.bean import Bean, Sex
-from src.beans.environment.food_manager import FoodType, HybridFoodManager
-from src.beans.genetics import create_phenotype, create_random_genotype
-from src.config.loader import DEFAULT_BEANS_CONFIG, DEFAULT_ENVIRONMENT_CONFIG, DEFAULT_WORLD_CONFIG
+from beans.bean import Bean, Sex
+from beans.environment.food_manager import FoodType, HybridFoodManager
+from beans.genetics import Phenotype
+from config.loader import DEFAULT_BEANS_CONFIG, DEFAULT_ENVIRONMENT_CONFIG, DEFAULT_WORLD_CONFIG
+from tests.helpers import make_genotype
 
 
 class DummyCollisionSystem:
@@ -12,15 +13,8 @@ class DummyCollisionSystem:
         return self.food_manager.consume_food_at_position(bean, position)
 
 def make_bean(size=10.0, sex=Sex.MALE, id=1):
-    beans_config = DEFAULT_BEANS_CONFIG
-    genotype = create_random_genotype()
-    phenotype = create_phenotype(beans_config, genotype)
-    bean = Bean(beans_config, id, sex, genotype=genotype, phenotype=phenotype)
-    state = bean.to_state()
-    state.size = size
-    state.target_size = size
-    state.energy = 50.0
-    bean.update_from_state(state)
+    phenotype = Phenotype(age=0.0, speed=0.0, energy=50.0, size=size, target_size=size)
+    bean = Bean(DEFAULT_BEANS_CONFIG, id, sex, genotype=make_genotype(), phenotype=phenotype)
     return bean
 
 def test_bean_eats_food_increases_energy_and_decreases_food():
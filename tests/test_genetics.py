@@ -1,5 +1,7 @@
+import copy
 import json
-import logging
+import pickle
+import random
 
 import pytest
 
@@ -10,11 +12,10 @@ from beans.genetics import (
     apply_age_gene_curve,
     create_random_genotype,
     genetic_max_age,
+    metabolism_factor,
 )
 from config.loader import BeansConfig, load_config
 
-logger = logging.getLogger(__name__)
-
 
 def test_age_speed_factor_respects_min_speed(monkeypatch):
     """age_speed_factor should never return less than config min_speed_factor (now uses config)."""
@@ -121,17 +122,70 @@ class TestGeneticMaxAge:
         assert result == beans_config.max_age_rounds * 0.1
 
 
+class TestMetabolismFactor:
+    """Tests for the METABOLISM_SPEED basal burn multiplier."""
+
+    @pytest.mark.parametrize(("gene_value", "expected"), [(0.0, 1.0), (0.5, 1.25), (1.0, 1.5)])
+    def test_factor_scales_with_gene(self, gene_value, expected):
+        genotype = Genotype(values=(gene_value, 0.5, 0.5, 0.5))
+        assert metabolism_factor(genotype) == pytest.approx(expected)
+
+
 class TestCreateRandomGenotype:
     """Tests for create_random_genotype applying age curve."""
 
-    def test_max_genetic_age_is_at_least_minimum(self):
-        """MAX_GENETIC_AGE should be at least 0.1 due to curve transformation."""
-        for _ in range(20):
-            genotype = create_random_genotype()
-            assert genotype.genes[Gene.MAX_GENETIC_AGE] >= 0.1
-
-    def test_max_genetic_age_is_at_most_1(self):
-        """MAX_GENETIC_AGE should be at most 1.0."""
-        for _ in range(20):
-            genotype = create_random_genotype()
-            assert genotype.genes[Gene.MAX_GENETIC_AGE] <= 1.0
+    def test_max_genetic_age_is_within_curve_range(self):
+        """MAX_GENETIC_AGE should stay within [0.1, 1.0] due to curve transformation."""
+        rng = random.Random(0)
+        ages = [create_random_genotype(rng)[Gene.MAX_GENETIC_AGE] for _ in range(40)]
+        assert min(ages) >= 0.1
+        assert max(ages) <= 1.0
+
+
+class TestGenotypeStorage:
+    """Tests for the fixed-order gene storage of Genotype."""
+
+    def test_values_follow_gene_order(self):
+        """Gene values are stored in Gene declaration order."""
+        genotype = Genotype(
+            genes={
+                Gene.MAX_GENETIC_AGE: 0.4,
+                Gene.FAT_ACCUMULATION: 0.3,
+                Gene.MAX_GENETIC_SPEED: 0.2,
+                Gene.METABOLISM_SPEED: 0.1,
+            }
+        )
+        assert genotype.values == (0.1, 0.2, 0.3, 0.4)
+
+    def test_indexing_by_gene_matches_genes_mapping(self):
+        """Indexing a genotype by Gene returns the same value as the genes mapping."""
+        genotype = Genotype(values=(0.1, 0.2, 0.3, 0.4))
+        for gene in Gene:
+            assert genotype[gene] == genotype.genes[gene]
+
+    def test_genes_mapping_is_read_only(self):
+        """The genes mapping cannot be used to change a genotype."""
+        genotype = Genotype(values=(0.1, 0.2, 0.3, 0.4))
+        with pytest.raises(TypeError):
+            genotype.genes[Gene.METABOLISM_SPEED] = 0.9
+        assert genotype[Gene.METABOLISM_SPEED] == 0.1
+
+    @pytest.mark.parametrize(
+        "clone",
+        [
+            pytest.param(copy.deepcopy, id="deepcopy"),
+            pytest.param(lambda genotype: pickle.loads(pickle.dumps(genotype)), id="pickle"),
+            pytest.param(lambda genotype: genotype.model_copy(deep=True), id="model_copy"),
+        ],
+    )
+    def test_genotype_survives_copy_round_trip(self, clone):
+        """Copied and unpickled genotypes keep their values and genes mapping."""
+        genotype = Genotype(values=(0.1, 0.2, 0.3, 0.4))
+        copied = clone(genotype)
+        assert copied == genotype
+        assert dict(copied.genes) == dict(genotype.genes)
+
+    def test_wrong_number_of_values_raises_error(self):
+        """A genotype needs exactly one value per gene."""
+        with pytest.raises(ValueError):
+            Genotype(values=(0.1, 0.2, 0.3))
@@ -2,10 +2,11 @@ import pytest
 
 from beans.bean import Bean, Sex
 from beans.environment.food_manager import FoodType
-from beans.genetics import Phenotype, create_random_genotype
+from beans.genetics import Phenotype
 from config.loader import BeansConfig
 from rendering.bean_sprite import BeanSprite
 from rendering.movement import SpriteMovementSystem
+from tests.helpers import make_genotype
 
 
 class DummyFoodManager:
@@ -19,7 +20,7 @@ def make_sprite(bean, pos):
 
 def make_bean(beans_config, id=0, speed=0.0, energy=50.0, size=10.0):
     ph = Phenotype(age=0.0, speed=speed, energy=energy, size=size, target_size=size)
-    return Bean(config=beans_config, id=id, sex=Sex.MALE, genotype=create_random_genotype(), phenotype=ph)
+    return Bean(config=beans_config, id=id, sex=Sex.MALE, genotype=make_genotype(), phenotype=ph)
 
 def test_resolve_collisions_bean_food_and_deadbean():
     beans_config = BeansConfig(speed_min=1.0, speed_max=100.0, initial_energy=50.0, male_bean_color="blue", female_bean_color="red", max_age_rounds=100)
@@ -57,3 +58,24 @@ def test_resolve_collisions_bean_bean():
     adjusted, damage_report, food_collisions = mover.resolve_collisions(sprite_targets, 100, 100, food_items=food_items)
     # Should detect food_collisions == 0
     assert len(food_collisions) == 0
+
+
+def test_food_collisions_probe_cells_when_food_map_is_large():
+    beans_config = BeansConfig(
+        speed_min=1.0,
+        speed_max=100.0,
+        initial_energy=50.0,
+        male_bean_color="blue",
+        female_bean_color="red",
+        max_age_rounds=100,
+    )
+    sprite = make_sprite(make_bean(beans_config, id=1, size=10.0), (50, 50))
+    # Enough far-away food that probing the cells under the bean beats a full scan
+    food_dict = {(x, y): {"type": FoodType.COMMON, "value": 1.0} for x in range(200, 220) for y in range(200, 220)}
+    food_dict[(53, 54)] = {"type": FoodType.COMMON, "value": 5.0}  # distance 5.0, on the rim
+    food_dict[(54, 54)] = {"type": FoodType.COMMON, "value": 5.0}  # distance ~5.66, outside
+    food_dict[(50, 46)] = {"type": FoodType.DEAD_BEAN, "value": 7.0}
+
+    _, _, food_collisions = SpriteMovementSystem().resolve_collisions([(sprite, 50, 50)], 300, 300, food_items=food_dict)
+
+    assert {fc["position"] for fc in food_collisions} == {(53, 54), (50, 46)}
@@ -2,29 +2,33 @@ import logging
 import math
 import random
 
-from beans.placement import RandomPlacementStrategy
+import pytest
+
+from beans.placement import GridPlacementStrategy, RandomPlacementStrategy, SpatialHash, create_strategy_from_name
 
 logger = logging.getLogger(__name__)
 
 
 def test_random_placement_reproducible_with_seed():
-    random.seed(12345)
     strategy = RandomPlacementStrategy()
-    positions1 = strategy.place(5, width=100, height=100, size=10)
+    positions1 = strategy.place(5, width=100, height=100, size=10, rng=random.Random(12345))
+    positions2 = strategy.place(5, width=100, height=100, size=10, rng=random.Random(12345))
+
+    assert positions1 == positions2
 
+
+def test_random_placement_falls_back_to_global_random():
+    strategy = RandomPlacementStrategy()
     random.seed(12345)
-    positions2 = strategy.place(5, width=100, height=100, size=10)
+    positions = strategy.place(5, width=100, height=100, size=10)
 
-    assert positions1 == positions2
+    assert positions == strategy.place(5, width=100, height=100, size=10, rng=random.Random(12345))
 
 
 def test_random_placement_different_seeds_produces_different_positions():
-    random.seed(1)
     strategy = RandomPlacementStrategy()
-    positions1 = strategy.place(5, width=100, height=100, size=10)
-
-    random.seed(2)
-    positions2 = strategy.place(5, width=100, height=100, size=10)
+    positions1 = strategy.place(5, width=100, height=100, size=10, rng=random.Random(1))
+    positions2 = strategy.place(5, width=100, height=100, size=10, rng=random.Random(2))
 
     assert positions1 != positions2
 
@@ -43,9 +47,9 @@ def test_random_placement_negative_count_returns_empty():
 
 def test_random_placement_no_collisions():
     """Test that no two beans are placed closer than size distance"""
-    random.seed(1)  # Use a seed that would cause collisions without collision detection
     strategy = RandomPlacementStrategy()
-    positions = strategy.place(20, width=200, height=200, size=20)
+    # Use a seed that would cause collisions without collision detection
+    positions = strategy.place(20, width=200, height=200, size=20, rng=random.Random(1))
     logger.info("test_placement::test_random_placement_no_collisions: positions=\n" + "\n".join(str(p) for p in positions))
 
     # Check all pairs of positions
@@ -55,3 +59,58 @@ def test_random_placement_no_collisions():
             x2, y2 = positions[j]
             distance = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
             assert distance >= 20, f"Beans at positions {positions[i]} and {positions[j]} collide (distance: {distance})"
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "expected"),
+    [
+        (50.0, 50.0, True),  # same cell
+        (59.5, 50.0, True),  # neighbouring cell, just inside the distance
+        (60.0, 50.0, False),  # exactly at the distance counts as free
+        (35.0, 35.0, False),  # diagonal neighbour cell, too far
+        (90.0, 90.0, False),  # outside the 3x3 block
+    ],
+)
+def test_spatial_hash_has_point_within(x, y, expected):
+    spatial_hash = SpatialHash(cell_size=10, width=100, height=100)
+    spatial_hash.insert(50.0, 50.0)
+    assert spatial_hash.has_point_within(x, y, 10) is expected
+
+
+def test_random_placement_with_own_rng_ignores_global_state():
+    random.seed(1)
+    positions1 = RandomPlacementStrategy(rng=random.Random(7)).place(10, width=100, height=100, size=10)
+    random.seed(2)
+    positions2 = RandomPlacementStrategy(rng=random.Random(7)).place(10, width=100, height=100, size=10)
+
+    assert positions1 == positions2
+
+
+def test_random_placement_call_rng_overrides_strategy_rng():
+    strategy = RandomPlacementStrategy(rng=random.Random(7))
+    positions = strategy.place(10, width=100, height=100, size=10, rng=random.Random(3))
+
+    assert positions == RandomPlacementStrategy().place(10, width=100, height=100, size=10, rng=random.Random(3))
+
+
+def test_grid_placement_fills_rows_without_overlap():
+    positions = GridPlacementStrategy().place(7, width=35, height=100, size=10)
+
+    assert positions == [(5.0, 5.0), (15.0, 5.0), (25.0, 5.0), (5.0, 15.0), (15.0, 15.0), (25.0, 15.0), (5.0, 25.0)]
+
+
+@pytest.mark.parametrize("count,expected", [(0, 0), (-3, 0), (500, 100)])
+def test_grid_placement_count_is_bounded_by_grid_capacity(count, expected):
+    positions = GridPlacementStrategy().place(count, width=100, height=100, size=10)
+
+    assert len(positions) == expected
+    assert len(set(positions)) == expected
+
+
+@pytest.mark.parametrize("name", ["random", "unknown"])
+def test_create_strategy_from_name_passes_rng_to_random_strategy(name):
+    strategy = create_strategy_from_name(name, rng=random.Random(11))
+
+    assert strategy.place(5, width=100, height=100, size=10) == RandomPlacementStrategy().place(
+        5, width=100, height=100, size=10, rng=random.Random(11)
+    )
@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from beans.placement import RandomPlacementStrategy
+from tests.helpers import PLACEMENT_CASES, estimated_population
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark(group="placement")
+@pytest.mark.parametrize("width,height,population_density,sprite_size", PLACEMENT_CASES)
+def test_random_placement_benchmark(benchmark, width, height, population_density, sprite_size):
+    """Benchmark placement of the estimated population; run with `make benchmark`."""
+    total_count = estimated_population(width, height, population_density, sprite_size)
+    strategy = RandomPlacementStrategy()
+
+    positions = benchmark(lambda: strategy.place(total_count, width, height, sprite_size, rng=random.Random(0)))
+
+    assert len(positions) >= int(total_count * 0.9)
@@ -78,6 +78,23 @@ class TestConsecutiveFailureValidatorSaturationDetection:
         validator.mark_failed()
         assert validator.is_saturated() is True  # Give up
 
+    def test_saturated_flag_tracks_is_saturated(self):
+        """The saturated attribute read by placement must always agree with is_saturated()."""
+        validator = ConsecutiveFailureValidator(threshold=2)
+
+        for step in (validator.mark_failed, validator.mark_failed, validator.reset, validator.mark_failed):
+            step()
+            assert validator.saturated is validator.is_saturated()
+        assert ConsecutiveFailureValidator(threshold=0).saturated is True
+
+    def test_mark_failed_and_check_reports_saturation(self):
+        """The fused call counts the failure and reports saturation in one step."""
+        validator = ConsecutiveFailureValidator(threshold=2)
+
+        assert validator.mark_failed_and_check() is False
+        assert validator.mark_failed_and_check() is True
+        assert validator.consecutive_failures == 2
+
 
 class TestSpaceAvailabilityValidatorSaturationDetection:
     """Tests for SpaceAvailabilityValidator - detects when world is too crowded."""
@@ -166,3 +183,13 @@ class TestSpaceAvailabilityValidatorSaturationDetection:
         small_count = self._fill_until_saturated(validator_small, size=2)
         large_count = self._fill_until_saturated(validator_large, size=8)
         assert large_count < small_count
+
+    def test_overlapping_footprints_count_each_cell_once(self):
+        """Occupied cells are counted once even when footprints overlap or cross byte boundaries."""
+        validator = SpaceAvailabilityValidator(width=20, height=20, cell_size=1)
+
+        validator.mark_placed(x=5.0, y=5.0, size=4)
+        assert validator.occupied_count == 25
+
+        validator.mark_placed(x=7.0, y=5.0, size=4)
+        assert validator.occupied_count == 35
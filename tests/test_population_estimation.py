@@ -1,5 +1,3 @@
-import logging
-
 import pytest
 
 from beans.population import (
@@ -10,8 +8,6 @@ from beans.population import (
 from beans.world import World
 from config.loader import BeansConfig, EnvironmentConfig, WorldConfig
 
-logger = logging.getLogger(__name__)
-
 
 @pytest.mark.parametrize(
     "width,height,sprite_size,population_density,male_female_ratio",
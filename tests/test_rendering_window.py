@@ -4,10 +4,10 @@ This module contains tests for sprite creation, movement, color assignment,
 window events, and reporting in the simulation rendering layer.
 """
 
-import logging
 from unittest.mock import patch
 
 import arcade
+import pytest
 
 from beans.bean import Bean
 from beans.dynamics.bean_dynamics import BeanDynamics
@@ -18,30 +18,37 @@ from config.loader import BeansConfig, EnvironmentConfig, WorldConfig
 from rendering.window import WorldWindow
 from reporting.report import SimulationReport
 
-logger = logging.getLogger(__name__)
 
+def make_window_world(population_density: float = 0.1, **beans_overrides) -> World:
+    """Build a fresh 200x150 world for window tests.
 
-def test_sprite_position_updates_on_movement(monkeypatch):
-    """TDD: Ensure WorldWindow.on_update updates sprite positions after movement."""
+    Configs are rebuilt per call rather than shared, since tests swap beans
+    and systems on the world they get back.
+    """
     cfg = WorldConfig(
         male_sprite_color="blue",
         female_sprite_color="red",
         male_female_ratio=1.0,
         width=200,
         height=150,
-        population_density=0.1,
+        population_density=population_density,
         placement_strategy="random",
     )
-    bcfg = BeansConfig(
-        speed_min=10,
-        speed_max=10,
+    beans_kwargs = dict(
+        speed_min=-5,
+        speed_max=5,
         max_age_rounds=100,
         initial_bean_size=10,
         male_bean_color="blue",
         female_bean_color="red",
     )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    beans_kwargs.update(beans_overrides)
+    return World(cfg, BeansConfig(**beans_kwargs), env_config=EnvironmentConfig())
+
+
+def test_sprite_position_updates_on_movement(monkeypatch):
+    """TDD: Ensure WorldWindow.on_update updates sprite positions after movement."""
+    world = make_window_world(speed_min=10, speed_max=10)
     monkeypatch.setattr(arcade.Window, "__init__", _fake_arcade_init, raising=False)
     win = WorldWindow(world)
     sprite = win.bean_sprites[0]
@@ -125,25 +132,7 @@ def _fake_arcade_init(self, width, height, title):
 
 
 def test_world_window_esc_closes(monkeypatch):
-    cfg = WorldConfig(
-        male_sprite_color="blue",
-        female_sprite_color="red",
-        male_female_ratio=1.0,
-        width=200,
-        height=150,
-        population_density=0.1,
-        placement_strategy="random",
-    )
-    bcfg = BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        max_age_rounds=100,
-        initial_bean_size=10,
-        male_bean_color="blue",
-        female_bean_color="red",
-    )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    world = make_window_world()
 
     closed = {"called": False}
     monkeypatch.setattr(arcade.Window, "__init__", _fake_arcade_init, raising=False)
@@ -154,25 +143,7 @@ def test_world_window_esc_closes(monkeypatch):
 
 
 def test_world_window_calls_placement(monkeypatch):
-    cfg = WorldConfig(
-        male_sprite_color="blue",
-        female_sprite_color="red",
-        male_female_ratio=1.0,
-        width=200,
-        height=150,
-        population_density=0.1,
-        placement_strategy="random",
-    )
-    bcfg = BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        max_age_rounds=100,
-        initial_bean_size=10,
-        male_bean_color="blue",
-        female_bean_color="red",
-    )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    world = make_window_world()
 
     called = {"count": 0}
 
@@ -199,25 +170,8 @@ def test_world_window_calls_placement(monkeypatch):
 
 
 def test_world_window_sprite_colors(monkeypatch):
-    cfg = WorldConfig(
-        male_sprite_color="blue",
-        female_sprite_color="red",
-        male_female_ratio=1.0,
-        width=200,
-        height=150,
-        population_density=0.1,
-        placement_strategy="random",
-    )
-    bcfg = BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        max_age_rounds=100,
-        initial_bean_size=10,
-        male_bean_color="green",
-        female_bean_color="yellow",
-    )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    world = make_window_world(male_bean_color="green", female_bean_color="yellow")
+    bcfg = world.beans_config
 
     monkeypatch.setattr(arcade.Window, "__init__", _fake_arcade_init, raising=False)
     win = WorldWindow(world)
@@ -232,25 +186,7 @@ def test_world_window_sprite_colors(monkeypatch):
 
 
 def test_world_window_reports_when_empty(monkeypatch):
-    cfg = WorldConfig(
-        male_sprite_color="blue",
-        female_sprite_color="red",
-        male_female_ratio=1.0,
-        width=200,
-        height=150,
-        population_density=0.0,
-        placement_strategy="random",
-    )
-    bcfg = BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        max_age_rounds=100,
-        initial_bean_size=10,
-        male_bean_color="blue",
-        female_bean_color="red",
-    )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    world = make_window_world(population_density=0.0)
 
     class SpyReporter(SimulationReport):
         def __init__(self) -> None:
@@ -272,25 +208,7 @@ def test_world_window_reports_when_empty(monkeypatch):
 
 
 def test_world_window_pauses_when_empty(monkeypatch):
-    cfg = WorldConfig(
-        male_sprite_color="blue",
-        female_sprite_color="red",
-        male_female_ratio=1.0,
-        width=200,
-        height=150,
-        population_density=0.0,
-        placement_strategy="random",
-    )
-    bcfg = BeansConfig(
-        speed_min=-5,
-        speed_max=5,
-        max_age_rounds=100,
-        initial_bean_size=10,
-        male_bean_color="blue",
-        female_bean_color="red",
-    )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    world = make_window_world(population_density=0.0)
     world.beans = []
 
     step_calls = {"count": 0}
@@ -310,25 +228,8 @@ def test_world_window_pauses_when_empty(monkeypatch):
 
 
 def test_window_bounce_deducts_energy(monkeypatch):
-    cfg = WorldConfig(
-        male_sprite_color="blue",
-        female_sprite_color="red",
-        male_female_ratio=1.0,
-        width=200,
-        height=150,
-        population_density=0.1,
-        placement_strategy="random",
-    )
-    bcfg = BeansConfig(
-        speed_min=1.0,
-        speed_max=200.0,
-        max_age_rounds=100,
-        initial_bean_size=10,
-        male_bean_color="blue",
-        female_bean_color="red",
-    )
-    env_cfg = EnvironmentConfig()
-    world = World(cfg, bcfg, env_config=env_cfg)
+    world = make_window_world(speed_min=1.0, speed_max=200.0)
+    bcfg = world.beans_config
 
     monkeypatch.setattr(arcade.Window, "__init__", _fake_arcade_init, raising=False)
     win = WorldWindow(world)
@@ -369,7 +270,6 @@ def test_window_bounce_deducts_energy(monkeypatch):
     with patch.object(arcade, "draw_circle_filled", lambda *args, **kwargs: None):
         # Skip smoke test if _ctx is missing (headless or test env)
         if not hasattr(win, "_ctx"):
-            import pytest
             pytest.skip("Skipping on_draw smoke test: WorldWindow._ctx not available in headless/test environment.")
         try:
             win.on_draw()